@@ -8,7 +8,6 @@ import pytest
 import pytest_asyncio
 from uuid import uuid4, UUID
 from datetime import datetime, UTC
-from testcontainers.postgres import PostgresContainer
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 import sqlalchemy as sa
@@ -47,6 +46,9 @@ def postgres_container():
     Returns:
         PostgresContainer: Running PostgreSQL 16 container
     """
+    # Imported here so unit-only runs don't pay for loading the Docker client
+    from testcontainers.postgres import PostgresContainer
+
     with PostgresContainer("postgres:16", driver=None) as postgres:
         yield postgres
 
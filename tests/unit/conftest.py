@@ -0,0 +1,25 @@
+"""
+Pytest configuration shared by all unit tests.
+
+Marks every test under tests/unit with `unit`, so `pytest -m unit` selects
+the whole mocked suite without each module declaring its own pytestmark.
+"""
+
+from pathlib import Path
+
+import pytest
+
+
+_UNIT_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Add the `unit` marker to every collected item that lives under tests/unit.
+
+    Conftest hooks see the whole session's items, so items collected from
+    other directories (integration, BDD) are left untouched.
+    """
+    for item in items:
+        if _UNIT_DIR in item.path.parents:
+            item.add_marker(pytest.mark.unit)
@@ -0,0 +1,364 @@
+"""
+Pytest fixtures for service unit tests.
+
+Provides fresh mocked repositories, services wired to them, and model
+factories so tests don't rebuild them inline.
+
+Every fixture is function-scoped and no mock is shared between tests, so the
+service tests can be sharded across pytest-xdist workers in any order
+(pytest tests/unit/services -n auto).
+"""
+
+import pytest
+from datetime import date
+
+from app.models.fight import Fight
+from app.models.fighter import Fighter
+from app.models.fight_participation import FightParticipation
+from app.models.team import Team
+from app.models.country import Country
+from app.models.tag import Tag
+
+from app.services.fight_service import FightService
+from app.services.fighter_service import FighterService
+from app.services.tag_service import TagService
+from app.services.tag_type_service import TagTypeService
+from app.services.team_service import TeamService
+
+from tests.unit.services.stubs import (
+    FakeCountryRepo,
+    FakeFightRepo,
+    FakeFighterRepo,
+    FakeParticipationRepo,
+    FakeTagRepo,
+    FakeTagTypeRepo,
+    FakeTeamRepo,
+)
+from tests.unit.services.support import NOW, fast_uuid
+
+
+# ============================================================================
+# MOCK REPOSITORY FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def mock_fight_repo():
+    """
+    Stubbed FightRepository.
+
+    Returns:
+        FakeFightRepo: Fresh stub; every repository method is an AsyncMock
+    """
+    return FakeFightRepo()
+
+
+@pytest.fixture
+def mock_participation_repo():
+    """
+    Stubbed FightParticipationRepository.
+
+    Returns:
+        FakeParticipationRepo: Fresh stub; every repository method is an AsyncMock
+    """
+    return FakeParticipationRepo()
+
+
+@pytest.fixture
+def mock_fighter_repo():
+    """
+    Stubbed FighterRepository.
+
+    Returns:
+        FakeFighterRepo: Fresh stub; every repository method is an AsyncMock
+    """
+    return FakeFighterRepo()
+
+
+@pytest.fixture
+def mock_team_repo():
+    """
+    Stubbed TeamRepository.
+
+    Returns:
+        FakeTeamRepo: Fresh stub; every repository method is an AsyncMock
+    """
+    return FakeTeamRepo()
+
+
+@pytest.fixture
+def mock_country_repo():
+    """
+    Stubbed CountryRepository.
+
+    Returns:
+        FakeCountryRepo: Fresh stub; every repository method is an AsyncMock
+    """
+    return FakeCountryRepo()
+
+
+@pytest.fixture
+def mock_tag_repo():
+    """
+    Stubbed TagRepository.
+
+    Returns:
+        FakeTagRepo: Fresh stub; every repository method is an AsyncMock
+    """
+    return FakeTagRepo()
+
+
+@pytest.fixture
+def mock_tag_type_repo():
+    """
+    Stubbed TagTypeRepository.
+
+    Returns:
+        FakeTagTypeRepo: Fresh stub; every repository method is an AsyncMock
+    """
+    return FakeTagTypeRepo()
+
+
+# ============================================================================
+# SERVICE FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def fight_service(mock_fight_repo):
+    """
+    FightService wired with only a mocked FightRepository.
+
+    Request mock_fight_repo alongside it to configure or inspect the repository.
+
+    Returns:
+        FightService: Service under test
+    """
+    return FightService(mock_fight_repo)
+
+
+@pytest.fixture
+def fight_service_full(mock_fight_repo, mock_participation_repo, mock_fighter_repo):
+    """
+    FightService wired with fight, participation and fighter repository mocks.
+
+    Returns:
+        FightService: Service under test for create_with_participants/delete
+    """
+    return FightService(
+        fight_repository=mock_fight_repo,
+        participation_repository=mock_participation_repo,
+        fighter_repository=mock_fighter_repo
+    )
+
+
+@pytest.fixture
+def fight_service_with_tags(
+    mock_fight_repo,
+    mock_participation_repo,
+    mock_fighter_repo,
+    mock_tag_repo,
+    mock_tag_type_repo
+):
+    """
+    FightService wired with every repository mock, including tag and tag type.
+
+    Returns:
+        FightService: Service under test for add/update/deactivate/delete_tag
+    """
+    return FightService(
+        fight_repository=mock_fight_repo,
+        participation_repository=mock_participation_repo,
+        fighter_repository=mock_fighter_repo,
+        tag_repository=mock_tag_repo,
+        tag_type_repository=mock_tag_type_repo
+    )
+
+
+@pytest.fixture
+def fighter_service(mock_fighter_repo, mock_team_repo):
+    """
+    FighterService wired with mocked fighter and team repositories.
+
+    Returns:
+        FighterService: Service under test
+    """
+    return FighterService(mock_fighter_repo, mock_team_repo)
+
+
+@pytest.fixture
+def team_service(mock_team_repo, mock_country_repo):
+    """
+    TeamService wired with mocked team and country repositories.
+
+    Returns:
+        TeamService: Service under test
+    """
+    return TeamService(mock_team_repo, mock_country_repo)
+
+
+@pytest.fixture
+def tag_service(mock_tag_repo, mock_tag_type_repo):
+    """
+    TagService wired with mocked tag and tag type repositories.
+
+    Returns:
+        TagService: Service under test
+    """
+    return TagService(
+        tag_repository=mock_tag_repo,
+        tag_type_repository=mock_tag_type_repo
+    )
+
+
+@pytest.fixture
+def tag_type_service(mock_tag_type_repo):
+    """
+    TagTypeService wired with a mocked TagTypeRepository.
+
+    Returns:
+        TagTypeService: Service under test
+    """
+    return TagTypeService(tag_type_repository=mock_tag_type_repo)
+
+
+# ============================================================================
+# MODEL FACTORY FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def fight_factory():
+    """
+    Factory for active Fight instances.
+
+    Returns:
+        Callable[..., Fight]: Builds a Fight; keyword arguments override defaults
+
+    Example:
+        ```python
+        def test_update(fight_factory):
+            fight = fight_factory(location="Updated Location")
+        ```
+    """
+    def _make(**overrides):
+        fields = {
+            "id": fast_uuid(),
+            "date": date(2024, 6, 15),
+            "location": "Test",
+            "is_deactivated": False,
+            "created_at": NOW,
+        }
+        fields.update(overrides)
+        return Fight(**fields)
+
+    return _make
+
+
+@pytest.fixture
+def fighter_factory():
+    """
+    Factory for active Fighter instances.
+
+    Returns:
+        Callable[..., Fighter]: Builds a Fighter; keyword arguments override defaults
+    """
+    def _make(**overrides):
+        fields = {
+            "id": fast_uuid(),
+            "name": "Test Fighter",
+            "team_id": fast_uuid(),
+            "is_deactivated": False,
+            "created_at": NOW,
+        }
+        fields.update(overrides)
+        return Fighter(**fields)
+
+    return _make
+
+
+@pytest.fixture
+def team_factory():
+    """
+    Factory for active Team instances.
+
+    Returns:
+        Callable[..., Team]: Builds a Team; keyword arguments override defaults
+    """
+    def _make(**overrides):
+        fields = {
+            "id": fast_uuid(),
+            "name": "Test Team",
+            "country_id": fast_uuid(),
+            "is_deactivated": False,
+            "created_at": NOW,
+        }
+        fields.update(overrides)
+        return Team(**fields)
+
+    return _make
+
+
+@pytest.fixture
+def country_factory():
+    """
+    Factory for active Country instances.
+
+    Returns:
+        Callable[..., Country]: Builds a Country; keyword arguments override defaults
+    """
+    def _make(**overrides):
+        fields = {
+            "id": fast_uuid(),
+            "name": "United States",
+            "code": "USA",
+            "is_deactivated": False,
+            "created_at": NOW,
+        }
+        fields.update(overrides)
+        return Country(**fields)
+
+    return _make
+
+
+@pytest.fixture
+def tag_factory():
+    """
+    Factory for active Tag instances.
+
+    Returns:
+        Callable[..., Tag]: Builds a Tag; keyword arguments override defaults
+    """
+    def _make(**overrides):
+        fields = {
+            "id": fast_uuid(),
+            "tag_type_id": fast_uuid(),
+            "value": "singles",
+            "is_deactivated": False,
+            "created_at": NOW,
+        }
+        fields.update(overrides)
+        return Tag(**fields)
+
+    return _make
+
+
+@pytest.fixture
+def participation_factory():
+    """
+    Factory for FightParticipation instances.
+
+    Returns:
+        Callable[..., FightParticipation]: Builds a participation; keyword
+        arguments override defaults
+    """
+    def _make(**overrides):
+        fields = {
+            "id": fast_uuid(),
+            "fight_id": fast_uuid(),
+            "fighter_id": fast_uuid(),
+            "side": 1,
+            "role": "fighter",
+            "created_at": NOW,
+        }
+        fields.update(overrides)
+        return FightParticipation(**fields)
+
+    return _make
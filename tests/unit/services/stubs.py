@@ -0,0 +1,84 @@
+"""
+Hand-rolled repository doubles for service unit tests.
+
+Each Fake*Repo declares the async methods of one repository. The conftest
+fixtures (mock_fight_repo, mock_tag_type_repo, ...) return fresh instances;
+tests that wire a service by hand can instantiate them directly.
+"""
+
+from unittest.mock import AsyncMock
+
+
+class _RepositoryStub:
+    """
+    Hand-rolled stand-in for a repository.
+
+    Each name in `methods` is an AsyncMock, created on first access so tests
+    only pay for the methods they touch. Reading or assigning any other
+    attribute raises AttributeError, the same guarantee spec_set gives,
+    without introspecting the repository class.
+    """
+
+    methods: tuple[str, ...] = ()
+
+    def __getattr__(self, name):
+        if name not in self.methods:
+            raise AttributeError(f"{type(self).__name__} has no method {name!r}")
+        method = AsyncMock()
+        object.__setattr__(self, name, method)
+        return method
+
+    def __setattr__(self, name, value):
+        if name not in self.methods:
+            raise AttributeError(f"{type(self).__name__} has no method {name!r}")
+        object.__setattr__(self, name, value)
+
+
+class FakeFightRepo(_RepositoryStub):
+    methods = (
+        "create", "get_by_id", "list_all", "list_by_date_range",
+        "deactivate", "update", "delete", "refresh_session",
+    )
+
+
+class FakeParticipationRepo(_RepositoryStub):
+    methods = (
+        "create", "get_by_id", "list_by_fight", "list_by_fighter",
+        "delete", "check_fighter_participation",
+    )
+
+
+class FakeFighterRepo(_RepositoryStub):
+    methods = (
+        "create", "get_by_id", "list_all", "list_by_team", "list_by_country",
+        "deactivate", "update", "delete",
+    )
+
+
+class FakeTeamRepo(_RepositoryStub):
+    methods = (
+        "create", "get_by_id", "list_all", "list_by_country",
+        "update", "deactivate", "delete",
+    )
+
+
+class FakeCountryRepo(_RepositoryStub):
+    methods = (
+        "create", "get_by_id", "get_by_code", "list_all", "deactivate", "update",
+        "delete", "permanent_delete", "count_relationships", "replace",
+    )
+
+
+class FakeTagRepo(_RepositoryStub):
+    methods = (
+        "create", "get_by_id", "list_all", "list_by_fight", "get_by_fight_and_type",
+        "list_active_children", "update", "deactivate", "delete",
+        "cascade_deactivate_children",
+    )
+
+
+class FakeTagTypeRepo(_RepositoryStub):
+    methods = (
+        "create", "get_by_id", "get_by_name", "list_all",
+        "update", "deactivate", "delete",
+    )
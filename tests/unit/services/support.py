@@ -0,0 +1,21 @@
+"""
+Shared helpers for service unit tests.
+
+Plain functions and constants that are needed at import time (e.g. inside
+pytest.mark.parametrize arguments), where fixtures are not available.
+"""
+
+import itertools
+from datetime import datetime, UTC
+from uuid import UUID
+
+
+# Fixed created_at timestamp; no service unit test depends on the wall clock
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+_UUID_COUNTER = itertools.count(1)
+
+
+def fast_uuid() -> UUID:
+    """Return a unique UUID without hitting os.urandom (ids in unit tests only need to be distinct)."""
+    return UUID(int=next(_UUID_COUNTER), version=4)
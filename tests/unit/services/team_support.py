@@ -0,0 +1,37 @@
+"""
+Shared inputs for the TeamService create/update unit tests.
+
+Constants and factories that are needed at import time (e.g. inside
+pytest.mark.parametrize arguments), where fixtures are not available.
+"""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+
+# 101 characters exceeds the 100 char limit enforced by TeamService
+LONG_TEAM_NAME = "A" * 101
+
+# Country lookups TeamService rejects: (country is deactivated, expected message)
+UNUSABLE_COUNTRIES = [
+    pytest.param(False, "Country not found", id="non-existent"),
+    pytest.param(True, "Country is not active", id="deactivated"),
+]
+
+
+def fk_integrity_error() -> IntegrityError:
+    """
+    Build a fresh foreign key IntegrityError for a repository side_effect.
+
+    TeamService maps it to InvalidCountryError by matching "foreign key
+    constraint" in str(e); DBAPIError.__init__ formats `orig` into that message.
+    A new instance per test keeps raised tracebacks from piling up on a shared one.
+
+    Returns:
+        IntegrityError: Unraised foreign key violation
+    """
+    return IntegrityError(
+        statement="INSERT INTO teams...",
+        params={},
+        orig=Exception("foreign key constraint fails")
+    )
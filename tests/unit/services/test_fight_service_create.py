@@ -0,0 +1,90 @@
+"""
+Unit tests for FightService.create().
+
+Tests business logic layer for Fight operations with mocked repositories.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from datetime import date
+
+from app.services.fight_service import FightService
+from app.exceptions import ValidationError
+
+
+class TestFightServiceCreate:
+    """Test suite for fight creation with validation."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("winner_side", [1, 2, None])
+    async def test_create_fight_with_valid_data_succeeds(
+        self, fight_service, fight_factory, mock_fight_repo, winner_side
+    ):
+        """
+        Test that creating a fight with valid data succeeds.
+
+        winner_side may be 1, 2, or None (draw/unknown).
+        """
+        # Arrange
+        fight = fight_factory(
+            location="IMCF Worlds 2024",
+            video_url="https://youtube.com/watch?v=abc",
+            winner_side=winner_side
+        )
+        mock_fight_repo.create.return_value = fight
+
+        fight_data = {
+            "date": date(2024, 6, 15),
+            "location": "IMCF Worlds 2024",
+            "video_url": "https://youtube.com/watch?v=abc",
+            "winner_side": winner_side
+        }
+
+        # Act
+        result = await fight_service.create(fight_data)
+
+        # Assert
+        assert result == fight
+        assert result.winner_side == winner_side
+        assert mock_fight_repo.create.await_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fight_data,match", [
+        pytest.param(
+            {"date": date(2099, 12, 31), "location": "Future Tournament"},
+            "Fight date cannot be in the future",
+            id="future-date",
+        ),
+        pytest.param(
+            {"date": date(2024, 6, 15), "location": ""},
+            "Location is required",
+            id="empty-location",
+        ),
+        pytest.param(
+            {"date": date(2024, 6, 15), "location": "   "},
+            "Location is required",
+            id="whitespace-location",
+        ),
+        pytest.param(
+            # Invalid - must be 1, 2, or None
+            {"date": date(2024, 6, 15), "location": "Test", "winner_side": 3},
+            "Winner side must be 1, 2, or null",
+            id="invalid-winner-side",
+        ),
+    ])
+    async def test_create_fight_rejects_invalid_data(self, fight_data, match):
+        """
+        Test that creating a fight with invalid data raises ValidationError
+        without touching the repository.
+        """
+        # Arrange
+        # Validation fails before any repository call, so a plain MagicMock is
+        # enough; awaiting one would raise TypeError and fail the test anyway.
+        mock_fight_repo = MagicMock()
+        service = FightService(mock_fight_repo)
+
+        # Act & Assert
+        with pytest.raises(ValidationError, match=match):
+            await service.create(fight_data)
+
+        assert mock_fight_repo.create.call_count == 0
@@ -0,0 +1,368 @@
+"""
+Unit tests for FightService.create_with_participants().
+
+Covers participant validation (sides, duplicates, captains, format and
+category team sizes) and the atomic fight + participations + fight_format
+tag creation.
+
+Tests business logic layer for Fight operations with mocked repositories.
+"""
+
+from contextlib import nullcontext
+
+import pytest
+from unittest.mock import MagicMock, call
+from datetime import date
+
+from app.models.tag_type import TagType
+from app.exceptions import (
+    InvalidParticipantCountError,
+    ValidationError,
+)
+
+from tests.unit.services.support import NOW, fast_uuid
+
+
+# ============================================================================
+# create_with_participants INPUTS
+# ============================================================================
+# Built once per module. The service only reads these, so tests share them
+# rather than rebuilding the same dicts per test. Participant lists are tuples
+# so an accidental in-place edit fails loudly instead of leaking across tests.
+
+_FIGHT_ID = fast_uuid()
+_FIGHTER_IDS = tuple(fast_uuid() for _ in range(8))
+
+_FIGHT_DATA = {"date": date(2024, 6, 15), "location": "Test Arena"}
+
+
+def _participant(index, side, role="fighter"):
+    return {"fighter_id": _FIGHTER_IDS[index], "side": side, "role": role}
+
+
+_SINGLES_PARTICIPATIONS = (_participant(0, 1), _participant(1, 2))
+# Participation repository calls expected when _SINGLES_PARTICIPATIONS is saved for _FIGHT_ID
+_SINGLES_PARTICIPATION_CALLS = [
+    call({"fight_id": _FIGHT_ID, **participation}) for participation in _SINGLES_PARTICIPATIONS
+]
+_SOLO_PARTICIPATIONS = (_participant(0, 1),)
+# Both fighters on side 1, no one on side 2
+_ONE_SIDE_PARTICIPATIONS = (_participant(0, 1), _participant(1, 1))
+# Same fighter on both sides
+_DUPLICATE_FIGHTER_PARTICIPATIONS = (_participant(0, 1), _participant(0, 2), _participant(1, 2))
+# Two captains on side 1
+_TWO_CAPTAINS_PARTICIPATIONS = (
+    _participant(0, 1, "captain"),
+    _participant(1, 1, "captain"),
+    _participant(2, 2),
+    _participant(3, 2),
+)
+# 2 fighters on side 1, 1 on side 2 - invalid for singles
+_TWO_VS_ONE_PARTICIPATIONS = (_participant(0, 1), _participant(1, 1), _participant(2, 2))
+# 4 fighters per side - insufficient for melee (needs 5+)
+_FOUR_VS_FOUR_PARTICIPATIONS = tuple(_participant(i, 1 if i < 4 else 2) for i in range(8))
+
+
+class TestFightServiceCreateWithParticipants:
+    """Test suite for fight creation with participants (atomic transaction)."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fight_format,participations_data,match", [
+        pytest.param("singles", _SINGLES_PARTICIPATIONS, None, id="valid"),
+        pytest.param("singles", _ONE_SIDE_PARTICIPATIONS, "both sides", id="one-side-only"),
+        pytest.param(
+            "singles", _DUPLICATE_FIGHTER_PARTICIPATIONS, "duplicate fighter", id="duplicate-fighter"
+        ),
+        pytest.param(
+            "melee", _TWO_CAPTAINS_PARTICIPATIONS, "multiple captains", id="multiple-captains"
+        ),
+    ])
+    async def test_create_fight_with_participants(
+        self,
+        fight_service_full,
+        fight_factory,
+        fighter_factory,
+        mock_fight_repo,
+        mock_participation_repo,
+        mock_fighter_repo,
+        fight_format,
+        participations_data,
+        match
+    ):
+        """
+        Test that a fight and its participants are created together, and that
+        invalid participant lists are rejected before anything is created.
+
+        Scenarios:
+            Create fight with valid participants (atomic transaction)
+            Cannot create fight with participants on only one side
+            Cannot add same fighter twice to same fight
+            Cannot have multiple captains on same side
+        """
+        # Arrange
+        mock_fighter_repo.get_by_id.side_effect = {
+            fighter_id: fighter_factory(id=fighter_id) for fighter_id in _FIGHTER_IDS
+        }.get
+        fight = fight_factory(id=_FIGHT_ID, date=date(2025, 6, 15), location="Battle Arena Denver")
+        mock_fight_repo.create.return_value = fight
+
+        succeeds = match is None
+        expectation = nullcontext() if succeeds else pytest.raises(ValidationError, match=match)
+
+        # Act & Assert
+        with expectation:
+            result = await fight_service_full.create_with_participants(
+                _FIGHT_DATA, fight_format, participations_data
+            )
+
+        if succeeds:
+            assert result is fight
+        # Nothing is written unless every participant passes validation
+        assert mock_fight_repo.create.await_count == (1 if succeeds else 0)
+        assert mock_participation_repo.create.await_args_list == (
+            _SINGLES_PARTICIPATION_CALLS if succeeds else []
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_fight_requires_minimum_2_participants(
+        self, fight_service_full, mock_fight_repo
+    ):
+        """
+        Test that creating a fight with only 1 participant fails.
+
+        Scenario: Cannot create fight with only 1 participant
+        """
+        # Act & Assert
+        with pytest.raises(ValidationError, match="at least 2 participants"):
+            await fight_service_full.create_with_participants(
+                _FIGHT_DATA, "singles", _SOLO_PARTICIPATIONS
+            )
+
+        assert mock_fight_repo.create.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_create_fight_rejects_nonexistent_fighter(
+        self, fight_service_full, fighter_factory, mock_fight_repo, mock_fighter_repo
+    ):
+        """
+        Test that creating a fight with nonexistent fighter fails.
+
+        Scenario: Cannot create fight with nonexistent fighter
+        """
+        # Arrange
+        # Only the side 1 fighter exists; the side 2 fighter lookup returns None
+        fighter1 = fighter_factory(id=_FIGHTER_IDS[0], name="John Smith")
+        mock_fighter_repo.get_by_id.side_effect = {_FIGHTER_IDS[0]: fighter1}.get
+
+        # Act & Assert
+        with pytest.raises(ValidationError, match="not found"):
+            await fight_service_full.create_with_participants(
+                _FIGHT_DATA, "singles", _SINGLES_PARTICIPATIONS
+            )
+
+        assert mock_fight_repo.create.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_create_fight_creates_fight_format_tag(
+        self,
+        fight_service_with_tags,
+        fight_factory,
+        fighter_factory,
+        mock_fight_repo,
+        mock_fighter_repo,
+        mock_tag_repo,
+        mock_tag_type_repo
+    ):
+        """
+        Test that creating a fight also creates the fight_format tag linked to the fight.
+
+        Scenario: Fight must have exactly one fight_format tag (DD-007)
+        """
+        # Arrange
+        fight_id = fast_uuid()
+        fight_format_tag_type_id = fast_uuid()
+
+        # Mock fighter lookups
+        fighter1 = fighter_factory(id=_FIGHTER_IDS[0], name="John Smith")
+        fighter2 = fighter_factory(id=_FIGHTER_IDS[1], name="Jane Doe")
+        mock_fighter_repo.get_by_id.side_effect = {
+            _FIGHTER_IDS[0]: fighter1, _FIGHTER_IDS[1]: fighter2
+        }.get
+
+        # Mock fight_format TagType lookup
+        fight_format_tag_type = TagType(
+            id=fight_format_tag_type_id,
+            name="fight_format",
+            is_privileged=True,
+            is_deactivated=False,
+            created_at=NOW
+        )
+        mock_tag_type_repo.get_by_name.return_value = fight_format_tag_type
+
+        # Mock fight creation
+        fight = fight_factory(id=fight_id, date=date(2025, 6, 15), location="Battle Arena Denver")
+        mock_fight_repo.create.return_value = fight
+
+        # Act
+        result = await fight_service_with_tags.create_with_participants(
+            _FIGHT_DATA, "singles", _SINGLES_PARTICIPATIONS
+        )
+
+        # Assert
+        assert result.id == fight_id
+        assert mock_fight_repo.create.await_count == 1
+        assert mock_tag_repo.create.await_count == 1
+        # Verify tag created with correct data including fight_id (DD-008)
+        tag_call_args = mock_tag_repo.create.call_args[0][0]
+        assert tag_call_args["fight_id"] == fight_id
+        assert tag_call_args["tag_type_id"] == fight_format_tag_type_id
+        assert tag_call_args["value"] == "singles"
+
+    @pytest.mark.asyncio
+    async def test_singles_format_requires_exactly_one_fighter_per_side(
+        self, fight_service_full, fighter_factory, mock_fight_repo, mock_fighter_repo
+    ):
+        """
+        Test that singles format requires exactly 1 fighter per side.
+
+        Scenario: Singles fights must have exactly 1 fighter per side (DD-003)
+        """
+        # Arrange
+        mock_fighter_repo.get_by_id.side_effect = {
+            fighter_id: fighter_factory(id=fighter_id) for fighter_id in _FIGHTER_IDS
+        }.get
+
+        # Act & Assert
+        with pytest.raises(ValidationError, match="Singles.*exactly 1 fighter per side"):
+            await fight_service_full.create_with_participants(
+                _FIGHT_DATA, "singles", _TWO_VS_ONE_PARTICIPATIONS
+            )
+
+        assert mock_fight_repo.create.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_melee_format_requires_minimum_five_fighters_per_side(
+        self, fight_service_full, fighter_factory, mock_fight_repo, mock_fighter_repo
+    ):
+        """
+        Test that melee format requires at least 5 fighters per side.
+
+        Scenario: Melee fights must have minimum 5 fighters per side (DD-004)
+        """
+        # Arrange
+        mock_fighter_repo.get_by_id.side_effect = {
+            fighter_id: fighter_factory(id=fighter_id) for fighter_id in _FIGHTER_IDS
+        }.get
+
+        # Act & Assert
+        with pytest.raises(ValidationError, match="Melee.*at least 5 fighters per side"):
+            await fight_service_full.create_with_participants(
+                _FIGHT_DATA, "melee", _FOUR_VS_FOUR_PARTICIPATIONS
+            )
+
+        assert mock_fight_repo.create.await_count == 0
+
+
+# =============================================================================
+# Phase 3B: Team Size Enforcement Tests
+# =============================================================================
+
+class TestTeamSizeEnforcement:
+    """Test suite for team size enforcement (Phase 3B DD-019)."""
+
+    @pytest.mark.asyncio
+    async def test_create_fight_rejects_under_minimum_for_category(self, fight_service):
+        """
+        Test that creating a 5s fight with < 5 fighters per side is rejected.
+        
+        Given 4 fighters per side
+        When I try to create a melee fight with category "5s"
+        Then an InvalidParticipantCountError is raised
+        """
+        # Arrange
+        participations = [
+            {"fighter_id": fast_uuid(), "side": 1, "role": "fighter"},
+            {"fighter_id": fast_uuid(), "side": 1, "role": "fighter"},
+            {"fighter_id": fast_uuid(), "side": 1, "role": "fighter"},
+            {"fighter_id": fast_uuid(), "side": 1, "role": "fighter"},  # Only 4 on side 1
+            {"fighter_id": fast_uuid(), "side": 2, "role": "fighter"},
+            {"fighter_id": fast_uuid(), "side": 2, "role": "fighter"},
+            {"fighter_id": fast_uuid(), "side": 2, "role": "fighter"},
+            {"fighter_id": fast_uuid(), "side": 2, "role": "fighter"},
+            {"fighter_id": fast_uuid(), "side": 2, "role": "fighter"},  # 5 on side 2
+        ]
+        
+        # Act & Assert
+        with pytest.raises(InvalidParticipantCountError) as exc_info:
+            fight_service._validate_team_size_for_category_at_creation(participations, "5s")
+        
+        assert "requires 5-8 fighters per side" in str(exc_info.value)
+        assert "side 1 has 4" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_create_fight_rejects_over_maximum_for_category(self, fight_service):
+        """
+        Test that creating a 5s fight with > 8 fighters per side is rejected.
+        """
+        # Arrange
+        participations = [
+            {"fighter_id": fast_uuid(), "side": side, "role": "fighter"}
+            for side in [1, 2]
+            for _ in range(10)  # 10 per side (exceeds max of 8)
+        ]
+        
+        # Act & Assert
+        with pytest.raises(InvalidParticipantCountError) as exc_info:
+            fight_service._validate_team_size_for_category_at_creation(participations, "5s")
+        
+        assert "requires 5-8 fighters per side" in str(exc_info.value)
+        assert "has 10" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_create_fight_accepts_valid_team_size(self, fight_service):
+        """
+        Test that creating a 5s fight with 6 fighters per side succeeds.
+        """
+        # Arrange
+        participations = [
+            {"fighter_id": fast_uuid(), "side": side, "role": "fighter"}
+            for side in [1, 2]
+            for _ in range(6)  # 6 per side (within 5-8 range)
+        ]
+        
+        # Act & Assert - should not raise
+        try:
+            fight_service._validate_team_size_for_category_at_creation(participations, "5s")
+        except Exception as e:
+            pytest.fail(f"Unexpected exception: {e}")
+
+    @pytest.mark.asyncio
+    async def test_update_category_validates_team_size(
+        self, fight_service, participation_factory
+    ):
+        """
+        Test that updating category validates current participation count.
+        
+        Given a fight with 6 fighters per side and category="5s"
+        When I try to update category to "10s" (requires 10-15)
+        Then an InvalidParticipantCountError is raised
+        """
+        # Arrange
+        fight_id = fast_uuid()
+        
+        # Mock fight with 6 participations per side
+        fight = MagicMock()
+        fight.id = fight_id
+        fight.participations = [
+            participation_factory(fight_id=fight_id, fighter_id=fast_uuid(), side=side)
+            for side in [1, 2]
+            for _ in range(6)  # 6 per side
+        ]
+        
+        # Act & Assert
+        with pytest.raises(InvalidParticipantCountError) as exc_info:
+            # Calling _validate_team_size_for_category directly
+            fight_service._validate_team_size_for_category(fight, "10s")
+        
+        assert "requires 10-15 fighters per side" in str(exc_info.value)
+        assert "side 1 has 6" in str(exc_info.value)
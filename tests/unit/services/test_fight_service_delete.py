@@ -0,0 +1,83 @@
+"""
+Unit tests for FightService.deactivate() and delete().
+
+Tests business logic layer for Fight operations with mocked repositories.
+"""
+
+import pytest
+
+from app.exceptions import FightNotFoundError
+
+from tests.unit.services.support import fast_uuid
+
+
+class TestFightServiceDeactivate:
+    """Test suite for fight deactivate operations."""
+
+    @pytest.mark.asyncio
+    async def test_deactivate_fight_succeeds(self, fight_service, mock_fight_repo):
+        """
+        Test that deactivating a fight succeeds.
+        """
+        # Arrange
+        fight_id = fast_uuid()
+
+        # Act
+        await fight_service.deactivate(fight_id)
+
+        # Assert
+        mock_fight_repo.deactivate.assert_awaited_once_with(fight_id)
+
+    @pytest.mark.asyncio
+    async def test_deactivate_non_existent_fight_raises_error(self, fight_service, mock_fight_repo):
+        """
+        Test that soft deleting non-existent fight raises FightNotFoundError.
+        """
+        # Arrange
+        mock_fight_repo.deactivate.side_effect = ValueError("Fight not found")
+
+        # Act & Assert
+        with pytest.raises(FightNotFoundError):
+            await fight_service.deactivate(fast_uuid())
+
+
+class TestFightServicePermanentDelete:
+    """Test suite for Fight permanent delete business logic."""
+
+    @pytest.mark.asyncio
+    async def test_delete_fight_delegates_to_repository(self, fight_service_full, mock_fight_repo):
+        """
+        Test that delete calls repository.delete() and succeeds.
+
+        Arrange: Mock repository returning None (no error)
+        Act: Call service.delete()
+        Assert: Repository delete called with correct ID
+        """
+        # Arrange
+        mock_fight_repo.delete.return_value = None
+
+        fight_id = fast_uuid()
+
+        # Act
+        await fight_service_full.delete(fight_id)
+
+        # Assert
+        mock_fight_repo.delete.assert_awaited_once_with(fight_id)
+
+    @pytest.mark.asyncio
+    async def test_delete_non_existent_fight_raises_error(
+        self, fight_service_full, mock_fight_repo
+    ):
+        """
+        Test that deleting non-existent fight raises FightNotFoundError.
+
+        Arrange: Mock repository raising ValueError
+        Act: Call service.delete()
+        Assert: FightNotFoundError raised
+        """
+        # Arrange
+        mock_fight_repo.delete.side_effect = ValueError("Fight not found")
+
+        # Act & Assert
+        with pytest.raises(FightNotFoundError):
+            await fight_service_full.delete(fast_uuid())
@@ -0,0 +1,89 @@
+"""
+Unit tests for FightService retrieval (get_by_id, list_all, list_by_date_range).
+
+Tests business logic layer for Fight operations with mocked repositories.
+"""
+
+import pytest
+from datetime import date
+
+from app.exceptions import FightNotFoundError
+
+from tests.unit.services.support import fast_uuid
+
+
+class TestFightServiceRetrieve:
+    """Test suite for fight retrieval operations."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_returns_fight_when_exists(
+        self, fight_service, fight_factory, mock_fight_repo
+    ):
+        """
+        Test that get_by_id returns fight when it exists.
+        """
+        # Arrange
+        fight_id = fast_uuid()
+        fight = fight_factory(id=fight_id)
+
+        mock_fight_repo.get_by_id.return_value = fight
+
+        # Act
+        result = await fight_service.get_by_id(fight_id)
+
+        # Assert
+        assert result == fight
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_raises_not_found_when_not_exists(self, fight_service, mock_fight_repo):
+        """
+        Test that get_by_id raises FightNotFoundError when fight doesn't exist.
+        """
+        # Arrange
+        mock_fight_repo.get_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(FightNotFoundError):
+            await fight_service.get_by_id(fast_uuid())
+
+    @pytest.mark.asyncio
+    async def test_list_all_returns_all_fights(self, fight_service, fight_factory, mock_fight_repo):
+        """
+        Test that list_all returns all non-deleted fights.
+        """
+        # Arrange
+        fights = [
+            fight_factory(date=date(2024, 1, 1), location="Fight 1"),
+            fight_factory(date=date(2024, 2, 1), location="Fight 2"),
+        ]
+
+        mock_fight_repo.list_all.return_value = fights
+
+        # Act
+        result = await fight_service.list_all()
+
+        # Assert
+        assert len(result) == 2
+
+    @pytest.mark.asyncio
+    async def test_list_by_date_range_returns_filtered_fights(
+        self, fight_service, fight_factory, mock_fight_repo
+    ):
+        """
+        Test that list_by_date_range returns fights within the range.
+        """
+        # Arrange
+        fights = [
+            fight_factory(location="Fight 1"),
+        ]
+
+        mock_fight_repo.list_by_date_range.return_value = fights
+
+        # Act
+        result = await fight_service.list_by_date_range(
+            start_date=date(2024, 6, 1),
+            end_date=date(2024, 6, 30)
+        )
+
+        # Assert
+        assert len(result) == 1
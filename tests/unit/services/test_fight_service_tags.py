@@ -0,0 +1,910 @@
+"""
+Unit tests for FightService fight-scoped tag management.
+
+Covers add_tag, update_tag, deactivate_tag and delete_tag, including
+weapon/league/ruleset value validation and category change cascades.
+
+Tests business logic layer for Fight operations with mocked repositories.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from datetime import date
+
+from app.models.fight import Fight
+from app.models.tag import Tag
+from app.models.tag_type import TagType
+from app.exceptions import (
+    FightNotFoundError,
+    InvalidTagError,
+    InvalidTagValueError,
+    MissingParentTagError,
+    ValidationError,
+)
+
+from tests.unit.services.support import NOW, fast_uuid
+
+
+class TestFightServiceAddTag:
+    """Test suite for FightService.add_tag() - fight-scoped tag management."""
+
+    @pytest.mark.asyncio
+    async def test_add_tag_creates_tag_linked_to_fight(
+        self, fight_factory, fight_service_with_tags,
+        mock_fight_repo, mock_tag_repo, mock_tag_type_repo
+    ):
+        """
+        Test that add_tag creates a tag with the correct fight_id and tag_type_id.
+
+        Scenario: Add a valid category tag to a singles fight
+        """
+        fight_id = fast_uuid()
+        category_tag_type_id = fast_uuid()
+        tag_id = fast_uuid()
+
+        # Create a minimal fight mock with is_deactivated=False and tags=[]
+        fight = fight_factory(id=fight_id, date=date(2025, 1, 10), location="Arena")
+        fight.tags = []  # No existing tags
+
+        category_tag_type = TagType(
+            id=category_tag_type_id,
+            name="category",
+            is_privileged=True,
+            is_deactivated=False,
+            created_at=NOW
+        )
+
+        # The existing fight_format tag on the fight (needed for compatibility check)
+        fight_format_tag_type_id = fast_uuid()
+        fight_format_tag_type = TagType(
+            id=fight_format_tag_type_id,
+            name="fight_format",
+            is_privileged=True,
+            is_deactivated=False,
+            created_at=NOW
+        )
+        sc_tag = Tag(
+            id=fast_uuid(),
+            fight_id=fight_id,
+            tag_type_id=fight_format_tag_type_id,
+            value="singles",
+            is_deactivated=False,
+            created_at=NOW
+        )
+        sc_tag.tag_type = fight_format_tag_type
+        fight.tags = [sc_tag]
+
+        expected_tag = Tag(
+            id=tag_id,
+            fight_id=fight_id,
+            tag_type_id=category_tag_type_id,
+            value="duel",
+            is_deactivated=False,
+            created_at=NOW
+        )
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_type_repo.get_by_name.return_value = category_tag_type
+        mock_tag_repo.create.return_value = expected_tag
+
+        # Act
+        result = await fight_service_with_tags.add_tag(
+            fight_id, tag_type_name="category", value="duel"
+        )
+
+        # Assert
+        assert result.value == "duel"
+        assert result.fight_id == fight_id
+        assert mock_tag_repo.create.await_count == 1
+        call_args = mock_tag_repo.create.call_args[0][0]
+        assert call_args["fight_id"] == fight_id
+        assert call_args["tag_type_id"] == category_tag_type_id
+        assert call_args["value"] == "duel"
+
+    @pytest.mark.asyncio
+    async def test_add_tag_raises_error_for_nonexistent_fight(
+        self, fight_service_with_tags, mock_fight_repo, mock_tag_type_repo
+    ):
+        """Test that add_tag raises FightNotFoundError when fight does not exist."""
+        mock_fight_repo.get_by_id.return_value = None
+        mock_tag_type_repo.get_by_name.return_value = None
+
+        with pytest.raises(FightNotFoundError):
+            await fight_service_with_tags.add_tag(
+                fast_uuid(), tag_type_name="category", value="duel"
+            )
+
+    @pytest.mark.asyncio
+    async def test_add_tag_raises_error_for_unknown_tag_type(
+        self, fight_factory, fight_service_with_tags, mock_fight_repo, mock_tag_type_repo
+    ):
+        """Test that add_tag raises ValidationError for unknown tag_type_name."""
+        fight = fight_factory(date=date(2025, 1, 10), location="Arena")
+        fight.tags = []
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_type_repo.get_by_name.return_value = None
+
+        with pytest.raises(ValidationError, match="[Uu]nknown tag type|tag.type.*not found"):
+            await fight_service_with_tags.add_tag(
+                fast_uuid(), tag_type_name="bogus", value="whatever"
+            )
+
+    def _make_fight_with_fight_format(self, fight_format_value: str):
+        """Build a Fight instance with an active fight_format tag attached."""
+        fight_id = fast_uuid()
+        sc_tag_type = TagType(
+            id=fast_uuid(), name="fight_format",
+            is_privileged=True, is_deactivated=False, created_at=NOW
+        )
+        sc_tag = Tag(
+            id=fast_uuid(), fight_id=fight_id,
+            tag_type_id=sc_tag_type.id,
+            value=fight_format_value,
+            is_deactivated=False, created_at=NOW
+        )
+        sc_tag.tag_type = sc_tag_type
+
+        fight = Fight(
+            id=fight_id, date=date(2025, 1, 10),
+            location="Arena", is_deactivated=False, created_at=NOW
+        )
+        fight.tags = [sc_tag]
+        return fight
+
+    @pytest.mark.asyncio
+    async def test_add_category_tag_rejects_melee_value_for_singles_fight(
+        self, fight_service_with_tags, mock_fight_repo, mock_tag_type_repo
+    ):
+        """
+        Scenario: Cannot add a melee category to a singles fight
+        """
+        fight = self._make_fight_with_fight_format("singles")
+        category_tag_type = TagType(
+            id=fast_uuid(), name="category", is_privileged=True,
+            is_deactivated=False, created_at=NOW
+        )
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_type_repo.get_by_name.return_value = category_tag_type
+
+        with pytest.raises(ValidationError, match="5s|not valid for fight_format 'singles'"):
+            await fight_service_with_tags.add_tag(fight.id, tag_type_name="category", value="5s")
+
+    @pytest.mark.asyncio
+    async def test_add_category_tag_rejects_singles_value_for_melee_fight(
+        self, fight_service_with_tags, mock_fight_repo, mock_tag_type_repo
+    ):
+        """
+        Scenario: Cannot add a singles category to a melee fight
+        """
+        fight = self._make_fight_with_fight_format("melee")
+        category_tag_type = TagType(
+            id=fast_uuid(), name="category", is_privileged=True,
+            is_deactivated=False, created_at=NOW
+        )
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_type_repo.get_by_name.return_value = category_tag_type
+
+        with pytest.raises(ValidationError, match="duel|not valid for fight_format 'melee'"):
+            await fight_service_with_tags.add_tag(fight.id, tag_type_name="category", value="duel")
+
+    @pytest.mark.asyncio
+    async def test_add_category_tag_rejects_second_active_category(
+        self, fight_service_with_tags, mock_fight_repo, mock_tag_type_repo
+    ):
+        """
+        Scenario: Cannot add two active category tags to the same fight (one-per-type rule)
+        """
+        fight = self._make_fight_with_fight_format("singles")
+        category_tag_type_id = fast_uuid()
+        category_tag_type = TagType(
+            id=category_tag_type_id, name="category", is_privileged=True,
+            is_deactivated=False, created_at=NOW
+        )
+        # Add an existing active category tag
+        existing_cat_tag = Tag(
+            id=fast_uuid(), fight_id=fight.id,
+            tag_type_id=category_tag_type_id,
+            value="duel", is_deactivated=False, created_at=NOW
+        )
+        existing_cat_tag.tag_type = category_tag_type
+        fight.tags.append(existing_cat_tag)
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_type_repo.get_by_name.return_value = category_tag_type
+
+        with pytest.raises(ValidationError, match="already has an active category tag"):
+            await fight_service_with_tags.add_tag(
+                fight.id, tag_type_name="category", value="profight"
+            )
+
+    @pytest.mark.asyncio
+    async def test_add_gender_tag_with_valid_value_succeeds(
+        self, fight_service_with_tags, mock_fight_repo, mock_tag_repo, mock_tag_type_repo
+    ):
+        """
+        Scenario: Add a gender tag to a fight
+        """
+        fight = self._make_fight_with_fight_format("singles")
+        gender_tag_type_id = fast_uuid()
+        gender_tag_type = TagType(
+            id=gender_tag_type_id, name="gender", is_privileged=False,
+            is_deactivated=False, created_at=NOW
+        )
+        expected_tag = Tag(
+            id=fast_uuid(), fight_id=fight.id,
+            tag_type_id=gender_tag_type_id,
+            value="male", is_deactivated=False, created_at=NOW
+        )
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_type_repo.get_by_name.return_value = gender_tag_type
+        mock_tag_repo.create.return_value = expected_tag
+
+        result = await fight_service_with_tags.add_tag(
+            fight.id, tag_type_name="gender", value="male"
+        )
+
+        assert result.value == "male"
+        assert mock_tag_repo.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_add_gender_tag_rejects_invalid_value(
+        self, fight_service_with_tags, mock_fight_repo, mock_tag_type_repo
+    ):
+        """
+        Scenario: Cannot add an invalid gender value
+        """
+        fight = self._make_fight_with_fight_format("singles")
+        gender_tag_type = TagType(
+            id=fast_uuid(), name="gender", is_privileged=False,
+            is_deactivated=False, created_at=NOW
+        )
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_type_repo.get_by_name.return_value = gender_tag_type
+
+        with pytest.raises(ValidationError, match="[Ii]nvalid gender value"):
+            await fight_service_with_tags.add_tag(fight.id, tag_type_name="gender", value="unknown")
+
+    @pytest.mark.asyncio
+    async def test_add_custom_tag_succeeds(
+        self, fight_service_with_tags, mock_fight_repo, mock_tag_repo, mock_tag_type_repo
+    ):
+        """
+        Scenario: Add a custom tag to a fight
+        """
+        fight = self._make_fight_with_fight_format("singles")
+        custom_tag_type_id = fast_uuid()
+        custom_tag_type = TagType(
+            id=custom_tag_type_id, name="custom", is_privileged=False,
+            is_deactivated=False, created_at=NOW
+        )
+        expected_tag = Tag(
+            id=fast_uuid(), fight_id=fight.id,
+            tag_type_id=custom_tag_type_id,
+            value="great technique", is_deactivated=False, created_at=NOW
+        )
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_type_repo.get_by_name.return_value = custom_tag_type
+        mock_tag_repo.create.return_value = expected_tag
+
+        result = await fight_service_with_tags.add_tag(
+            fight.id, tag_type_name="custom", value="great technique"
+        )
+
+        assert result.value == "great technique"
+
+    @pytest.mark.asyncio
+    async def test_add_tag_rejects_deactivated_fight(
+        self, fight_service_with_tags, mock_fight_repo
+    ):
+        """Test that add_tag raises FightNotFoundError for a deactivated fight."""
+        # get_by_id with include_deactivated=False returns None for deactivated fights
+        mock_fight_repo.get_by_id.return_value = None
+
+        with pytest.raises(FightNotFoundError):
+            await fight_service_with_tags.add_tag(
+                fast_uuid(), tag_type_name="category", value="duel"
+            )
+
+    @pytest.mark.asyncio
+    async def test_add_custom_tag_allows_multiple_per_fight(
+        self, fight_service_with_tags, mock_fight_repo, mock_tag_repo, mock_tag_type_repo
+    ):
+        """
+        Scenario: Fight can have multiple custom tags (no one-per-type restriction)
+        """
+        fight = self._make_fight_with_fight_format("singles")
+        custom_tag_type_id = fast_uuid()
+        custom_tag_type = TagType(
+            id=custom_tag_type_id, name="custom", is_privileged=False,
+            is_deactivated=False, created_at=NOW
+        )
+        # An existing custom tag
+        existing_custom = Tag(
+            id=fast_uuid(), fight_id=fight.id,
+            tag_type_id=custom_tag_type_id,
+            value="exciting", is_deactivated=False, created_at=NOW
+        )
+        existing_custom.tag_type = custom_tag_type
+        fight.tags.append(existing_custom)
+
+        second_custom = Tag(
+            id=fast_uuid(), fight_id=fight.id,
+            tag_type_id=custom_tag_type_id,
+            value="controversial", is_deactivated=False, created_at=NOW
+        )
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_type_repo.get_by_name.return_value = custom_tag_type
+        mock_tag_repo.create.return_value = second_custom
+
+        # Should NOT raise even though another custom tag exists
+        result = await fight_service_with_tags.add_tag(
+            fight.id, tag_type_name="custom", value="controversial"
+        )
+
+        assert result.value == "controversial"
+
+
+class TestFightServiceDeactivateTag:
+    """Test suite for FightService.deactivate_tag() - deactivate a fight's tag."""
+
+    @pytest.mark.asyncio
+    async def test_deactivate_tag_raises_fight_not_found(
+        self, fight_service_with_tags, mock_fight_repo
+    ):
+        """Test that deactivate_tag raises FightNotFoundError when fight not found."""
+        mock_fight_repo.get_by_id.return_value = None
+
+        with pytest.raises(FightNotFoundError):
+            await fight_service_with_tags.deactivate_tag(fast_uuid(), fast_uuid())
+
+    @pytest.mark.asyncio
+    async def test_deactivate_tag_raises_not_found_when_tag_not_in_fight(
+        self, fight_factory, fight_service_with_tags, mock_fight_repo, mock_tag_repo
+    ):
+        """
+        Test that deactivate_tag raises ValidationError when the tag belongs to a different fight.
+        """
+        fight_id = fast_uuid()
+        other_fight_id = fast_uuid()
+        fight = fight_factory(id=fight_id, date=date(2025, 1, 10), location="Arena")
+        fight.tags = []
+
+        tag_type = TagType(id=fast_uuid(), name="gender", is_privileged=False,
+                           is_deactivated=False, created_at=NOW)
+        # Tag belongs to a DIFFERENT fight
+        tag = Tag(
+            id=fast_uuid(), fight_id=other_fight_id,
+            tag_type_id=tag_type.id, value="male",
+            is_deactivated=False, created_at=NOW
+        )
+        tag.tag_type = tag_type
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_repo.get_by_id.return_value = tag
+
+        with pytest.raises((ValidationError, Exception)):
+            await fight_service_with_tags.deactivate_tag(fight_id, tag.id)
+
+    @pytest.mark.asyncio
+    async def test_deactivate_tag_cascades_to_children(
+        self, fight_factory, fight_service_with_tags, mock_fight_repo, mock_tag_repo
+    ):
+        """
+        Test that deactivating a fight_format tag also deactivates its child tags.
+        """
+        fight_id = fast_uuid()
+        sc_tag_type = TagType(id=fast_uuid(), name="fight_format", is_privileged=True,
+                              is_deactivated=False, created_at=NOW)
+        cat_tag_type = TagType(id=fast_uuid(), name="category", is_privileged=True,
+                               is_deactivated=False, created_at=NOW)
+
+        sc_tag_id = fast_uuid()
+        cat_tag_id = fast_uuid()
+
+        sc_tag = Tag(
+            id=sc_tag_id, fight_id=fight_id,
+            tag_type_id=sc_tag_type.id, value="singles",
+            is_deactivated=False, created_at=NOW
+        )
+        sc_tag.tag_type = sc_tag_type
+
+        cat_tag = Tag(
+            id=cat_tag_id, fight_id=fight_id,
+            tag_type_id=cat_tag_type.id, value="duel",
+            parent_tag_id=sc_tag_id,
+            is_deactivated=False, created_at=NOW
+        )
+        cat_tag.tag_type = cat_tag_type
+
+        fight = fight_factory(id=fight_id, date=date(2025, 1, 10), location="Arena")
+        fight.tags = [sc_tag, cat_tag]
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_repo.get_by_id.return_value = sc_tag
+        # After deactivation, get_by_id (include_deactivated=True) returns deactivated tag
+        deactivated_sc_tag = Tag(
+            id=sc_tag_id, fight_id=fight_id,
+            tag_type_id=sc_tag_type.id, value="singles",
+            is_deactivated=True, created_at=NOW
+        )
+        mock_tag_repo.get_by_id.side_effect = [
+            sc_tag,         # first call: fetch tag to verify it belongs to fight
+            deactivated_sc_tag,  # second call: fetch after deactivation
+        ]
+        mock_tag_repo.cascade_deactivate_children.return_value = 1
+
+        result = await fight_service_with_tags.deactivate_tag(fight_id, sc_tag_id)
+
+        assert result.is_deactivated is True
+        mock_tag_repo.deactivate.assert_awaited_once_with(sc_tag_id)
+        mock_tag_repo.cascade_deactivate_children.assert_awaited_once_with(sc_tag_id)
+
+
+class TestFightServiceDeleteTag:
+    """Test suite for FightService.delete_tag() - hard delete with children guard (DD-012)."""
+
+    @pytest.mark.asyncio
+    async def test_delete_tag_raises_fight_not_found(
+        self, fight_service_with_tags, mock_fight_repo
+    ):
+        """Test that delete_tag raises FightNotFoundError when fight not found."""
+        mock_fight_repo.get_by_id.return_value = None
+
+        with pytest.raises(FightNotFoundError):
+            await fight_service_with_tags.delete_tag(fast_uuid(), fast_uuid())
+
+    @pytest.mark.asyncio
+    async def test_delete_tag_raises_not_found_when_tag_not_on_fight(
+        self, fight_factory, fight_service_with_tags, mock_fight_repo, mock_tag_repo
+    ):
+        """Test that delete_tag raises ValidationError when tag not on this fight."""
+        fight_id = fast_uuid()
+        fight = fight_factory(id=fight_id, date=date(2025, 1, 10), location="Arena")
+        fight.tags = []
+
+        # Tag belongs to a different fight
+        tag = Tag(
+            id=fast_uuid(), fight_id=fast_uuid(),  # different fight
+            tag_type_id=fast_uuid(), value="male",
+            is_deactivated=False, created_at=NOW
+        )
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_repo.get_by_id.return_value = tag
+
+        with pytest.raises((ValidationError, Exception)):
+            await fight_service_with_tags.delete_tag(fight_id, tag.id)
+
+    @pytest.mark.asyncio
+    async def test_delete_tag_rejects_when_active_children_exist(
+        self, fight_factory, fight_service_with_tags, mock_fight_repo, mock_tag_repo
+    ):
+        """
+        DD-012: Cannot delete a tag that has active child tags.
+        """
+        fight_id = fast_uuid()
+        sc_tag_id = fast_uuid()
+
+        sc_tag_type = TagType(id=fast_uuid(), name="fight_format", is_privileged=True,
+                              is_deactivated=False, created_at=NOW)
+        sc_tag = Tag(
+            id=sc_tag_id, fight_id=fight_id,
+            tag_type_id=sc_tag_type.id, value="singles",
+            is_deactivated=False, created_at=NOW
+        )
+        sc_tag.tag_type = sc_tag_type
+
+        # Active child tag
+        cat_tag = Tag(
+            id=fast_uuid(), fight_id=fight_id,
+            tag_type_id=fast_uuid(), value="duel",
+            parent_tag_id=sc_tag_id,
+            is_deactivated=False, created_at=NOW
+        )
+
+        fight = fight_factory(id=fight_id, date=date(2025, 1, 10), location="Arena")
+        fight.tags = [sc_tag, cat_tag]
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_repo.get_by_id.return_value = sc_tag
+        mock_tag_repo.list_active_children.return_value = [cat_tag]
+
+        with pytest.raises(ValidationError, match="[Cc]hildren|[Cc]hild tags"):
+            await fight_service_with_tags.delete_tag(fight_id, sc_tag_id)
+
+    @pytest.mark.asyncio
+    async def test_delete_tag_succeeds_when_no_children(
+        self, fight_factory, fight_service_with_tags, mock_fight_repo, mock_tag_repo
+    ):
+        """Test that delete_tag succeeds when no active children exist."""
+        fight_id = fast_uuid()
+        gender_tag_id = fast_uuid()
+
+        gender_tag_type = TagType(id=fast_uuid(), name="gender", is_privileged=False,
+                                  is_deactivated=False, created_at=NOW)
+        gender_tag = Tag(
+            id=gender_tag_id, fight_id=fight_id,
+            tag_type_id=gender_tag_type.id, value="male",
+            is_deactivated=False, created_at=NOW
+        )
+        gender_tag.tag_type = gender_tag_type
+
+        fight = fight_factory(id=fight_id, date=date(2025, 1, 10), location="Arena")
+        fight.tags = [gender_tag]
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_repo.get_by_id.return_value = gender_tag
+        mock_tag_repo.list_active_children.return_value = []
+
+        await fight_service_with_tags.delete_tag(fight_id, gender_tag_id)
+
+        mock_tag_repo.delete.assert_awaited_once_with(gender_tag_id)
+
+
+class TestFightServiceUpdateTag:
+    """Test suite for FightService.update_tag() - DD-011: fight_format immutability."""
+
+    @pytest.mark.asyncio
+    async def test_update_fight_format_tag_raises_validation_error(
+        self, fight_factory, fight_service_with_tags, mock_fight_repo, mock_tag_repo
+    ):
+        """
+        DD-011: fight_format is immutable after creation.
+        PATCH /fights/{id}/tags/{tag_id} must reject attempts to update a fight_format tag.
+        """
+        fight_id = fast_uuid()
+        sc_tag_type = TagType(id=fast_uuid(), name="fight_format", is_privileged=True,
+                              is_deactivated=False, created_at=NOW)
+        sc_tag = Tag(
+            id=fast_uuid(), fight_id=fight_id,
+            tag_type_id=sc_tag_type.id, value="singles",
+            is_deactivated=False, created_at=NOW
+        )
+        sc_tag.tag_type = sc_tag_type
+
+        fight = fight_factory(id=fight_id, date=date(2025, 1, 10), location="Arena")
+        fight.tags = [sc_tag]
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_repo.get_by_id.return_value = sc_tag
+
+        with pytest.raises(ValidationError, match="[Ss]upercategory.*immutable|[Cc]annot update fight_format"):
+            await fight_service_with_tags.update_tag(fight_id, sc_tag.id, new_value="melee")
+
+    @pytest.mark.asyncio
+    async def test_update_tag_raises_fight_not_found(
+        self, fight_service_with_tags, mock_fight_repo
+    ):
+        """Test that update_tag raises FightNotFoundError when fight not found."""
+        mock_fight_repo.get_by_id.return_value = None
+
+        with pytest.raises(FightNotFoundError):
+            await fight_service_with_tags.update_tag(fast_uuid(), fast_uuid(), new_value="duel")
+
+# =============================================================================
+# Phase 3B: Weapon Tag Validation Tests
+# =============================================================================
+
+
+class TestWeaponTagValidation:
+    """Test suite for weapon tag validation (Phase 3B)."""
+
+    @pytest.mark.asyncio
+    async def test_validate_weapon_tag_rejects_missing_category(self, fight_service):
+        """
+        Test that _validate_weapon_tag raises error when no category tag exists.
+        
+        Given no category tag on the fight
+        When I try to validate a weapon tag
+        Then a MissingParentTagError is raised
+        """
+        # Arrange
+        category_tag = None  # No category tag
+        weapon_value = "Longsword"
+        
+        # Act & Assert
+        with pytest.raises(MissingParentTagError) as exc_info:
+            fight_service._validate_weapon_tag(category_tag, weapon_value)
+        
+        assert "Weapon requires a category tag" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_validate_weapon_tag_rejects_non_duel_category(self, fight_service):
+        """
+        Test that _validate_weapon_tag raises error when category is not 'duel'.
+        
+        Given a category tag with value "profight" (not duel)
+        When I try to validate a weapon tag
+        Then an InvalidTagError is raised
+        """
+        # Arrange
+        # Create a mock category tag that is NOT "duel"
+        category_tag = Tag(
+            id=fast_uuid(),
+            fight_id=fast_uuid(),
+            tag_type_id=fast_uuid(),
+            value="profight",  # Not "duel"
+            is_deactivated=False,
+            created_at=NOW
+        )
+        weapon_value = "Longsword"
+        
+        # Act & Assert
+        with pytest.raises(InvalidTagError) as exc_info:
+            fight_service._validate_weapon_tag(category_tag, weapon_value)
+        
+        assert "only valid for 'duel' category" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_validate_weapon_tag_rejects_invalid_value(self, fight_service):
+        """
+        Test that _validate_weapon_tag raises error for invalid weapon value.
+        
+        Given a category tag with value "duel"
+        When I try to validate a weapon tag with invalid value "Trebuchet"
+        Then an InvalidTagValueError is raised with valid options
+        """
+        # Arrange
+        # Create a mock category tag with value "duel"
+        category_tag = Tag(
+            id=fast_uuid(),
+            fight_id=fast_uuid(),
+            tag_type_id=fast_uuid(),
+            value="duel",
+            is_deactivated=False,
+            created_at=NOW
+        )
+        weapon_value = "Trebuchet"  # Invalid weapon
+        
+        # Act & Assert
+        with pytest.raises(InvalidTagValueError) as exc_info:
+            fight_service._validate_weapon_tag(category_tag, weapon_value)
+        
+        # Error message should include valid options (DD-020)
+        error_msg = str(exc_info.value)
+        assert "Invalid weapon" in error_msg
+        assert "Valid options:" in error_msg
+        assert "Longsword" in error_msg  # One of the valid weapons
+
+    @pytest.mark.asyncio
+    async def test_validate_weapon_tag_accepts_valid_value(self, fight_service):
+        """
+        Test that _validate_weapon_tag accepts valid weapon value for duel category.
+        
+        Given a category tag with value "duel"
+        When I validate a weapon tag with valid value "Longsword"
+        Then no exception is raised
+        """
+        # Arrange
+        # Create a mock category tag with value "duel"
+        category_tag = Tag(
+            id=fast_uuid(),
+            fight_id=fast_uuid(),
+            tag_type_id=fast_uuid(),
+            value="duel",
+            is_deactivated=False,
+            created_at=NOW
+        )
+        weapon_value = "Longsword"  # Valid weapon
+        
+        # Act & Assert - should not raise any exception
+        try:
+            fight_service._validate_weapon_tag(category_tag, weapon_value)
+        except Exception as e:
+            pytest.fail(f"_validate_weapon_tag raised unexpected exception: {e}")
+
+
+# =============================================================================
+# Phase 3B: League Tag Validation Tests
+# =============================================================================
+
+
+class TestLeagueTagValidation:
+    """Test suite for league tag validation (Phase 3B)."""
+
+    @pytest.mark.asyncio
+    async def test_validate_league_tag_rejects_missing_category(self, fight_service):
+        """
+        Test that _validate_league_tag raises error when no category tag exists.
+        
+        Given no category tag on the fight
+        When I try to validate a league tag
+        Then a MissingParentTagError is raised
+        """
+        # Arrange
+        category_tag = None  # No category tag
+        league_value = "IMCF"
+        
+        # Act & Assert
+        with pytest.raises(MissingParentTagError) as exc_info:
+            fight_service._validate_league_tag(category_tag, league_value)
+        
+        assert "League requires a category tag" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_validate_league_tag_rejects_invalid_value_for_category(self, fight_service):
+        """
+        Test that _validate_league_tag raises error for invalid league for category.
+        
+        Given a category tag with value "3s"
+        When I try to validate league "HMB" (not valid for 3s)
+        Then an InvalidTagValueError is raised with valid options
+        """
+        # Arrange
+        category_tag = Tag(
+            id=fast_uuid(),
+            fight_id=fast_uuid(),
+            tag_type_id=fast_uuid(),
+            value="3s",
+            is_deactivated=False,
+            created_at=NOW
+        )
+        league_value = "HMB"  # Not valid for 3s
+        
+        # Act & Assert
+        with pytest.raises(InvalidTagValueError) as exc_info:
+            fight_service._validate_league_tag(category_tag, league_value)
+        
+        error_msg = str(exc_info.value)
+        assert "Invalid league 'HMB' for category '3s'" in error_msg
+        assert "Valid options:" in error_msg
+        assert "IMCF" in error_msg  # Valid for 3s
+
+    @pytest.mark.asyncio
+    async def test_validate_league_tag_accepts_valid_value(self, fight_service):
+        """
+        Test that _validate_league_tag accepts valid league value.
+        
+        Given a category tag with value "5s"
+        When I validate league "HMB" (valid for 5s)
+        Then no exception is raised
+        """
+        # Arrange
+        category_tag = Tag(
+            id=fast_uuid(),
+            fight_id=fast_uuid(),
+            tag_type_id=fast_uuid(),
+            value="5s",
+            is_deactivated=False,
+            created_at=NOW
+        )
+        league_value = "HMB"  # Valid for 5s
+        
+        # Act & Assert
+        try:
+            fight_service._validate_league_tag(category_tag, league_value)
+        except Exception as e:
+            pytest.fail(f"Unexpected exception: {e}")
+
+
+# =============================================================================
+# Phase 3B: Ruleset Tag Validation Tests
+# =============================================================================
+
+
+class TestRulesetTagValidation:
+    """Test suite for ruleset tag validation (Phase 3B)."""
+
+    @pytest.mark.asyncio
+    async def test_validate_ruleset_tag_rejects_missing_category(self, fight_service):
+        """Test that _validate_ruleset_tag raises error when no category tag exists."""
+        # Arrange
+        # Act & Assert
+        with pytest.raises(MissingParentTagError) as exc_info:
+            fight_service._validate_ruleset_tag(None, "IMCF")
+        
+        assert "Ruleset requires a category tag" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_validate_ruleset_tag_rejects_invalid_value_for_category(self, fight_service):
+        """Test that _validate_ruleset_tag raises error for invalid ruleset for category."""
+        # Arrange
+        category_tag = Tag(
+            id=fast_uuid(),
+            fight_id=fast_uuid(),
+            tag_type_id=fast_uuid(),
+            value="3s",
+            is_deactivated=False,
+            created_at=NOW
+        )
+        
+        # Act & Assert
+        with pytest.raises(InvalidTagValueError) as exc_info:
+            fight_service._validate_ruleset_tag(category_tag, "HMBIA")
+        
+        error_msg = str(exc_info.value)
+        assert "Invalid ruleset 'HMBIA' for category '3s'" in error_msg
+        assert "Valid options:" in error_msg
+
+    @pytest.mark.asyncio
+    async def test_validate_ruleset_tag_accepts_valid_value(self, fight_service):
+        """Test that _validate_ruleset_tag accepts valid ruleset value."""
+        # Arrange
+        category_tag = Tag(
+            id=fast_uuid(),
+            fight_id=fast_uuid(),
+            tag_type_id=fast_uuid(),
+            value="5s",
+            is_deactivated=False,
+            created_at=NOW
+        )
+        
+        # Act & Assert - should not raise
+        try:
+            fight_service._validate_ruleset_tag(category_tag, "HMBIA")
+        except Exception as e:
+            pytest.fail(f"Unexpected exception: {e}")
+
+
+# =============================================================================
+# Phase 3B: Category Change Cascade Tests
+# =============================================================================
+
+
+class TestCategoryChangeCascade:
+    """Test suite for category change cascade (Phase 3B DD-014)."""
+
+    @pytest.mark.asyncio
+    async def test_update_category_tag_cascades_delete_children(
+        self, fight_service_with_tags, mock_fight_repo, mock_tag_repo
+    ):
+        """
+        Test that updating category tag cascades deactivation to child tags.
+        
+        Given a fight with category="duel", weapon="Longsword", league="BI"
+        When I update the category tag to "profight"
+        Then the weapon and league child tags are deactivated
+        And the category value is updated to "profight"
+        """
+        # Arrange
+        fight_id = fast_uuid()
+        category_tag_id = fast_uuid()
+        weapon_tag_id = fast_uuid()
+        league_tag_id = fast_uuid()
+
+        # Mock fight with tags
+        fight = MagicMock()
+        fight.id = fight_id
+        fight.is_deactivated = False
+
+        # Create fight_format tag (required for category validation)
+        fight_format_type = TagType(id=fast_uuid(), name="fight_format")
+        fight_format_tag = Tag(
+            id=fast_uuid(),
+            fight_id=fight_id,
+            tag_type_id=fight_format_type.id,
+            value="singles",
+            is_deactivated=False,
+            created_at=NOW
+        )
+        fight_format_tag.tag_type = fight_format_type
+
+        category_type = TagType(id=fast_uuid(), name="category")
+        category_tag = Tag(
+            id=category_tag_id,
+            fight_id=fight_id,
+            tag_type_id=category_type.id,
+            value="duel",
+            is_deactivated=False,
+            created_at=NOW
+        )
+        category_tag.tag_type = category_type
+
+        # Add tags to fight
+        fight.tags = [fight_format_tag, category_tag]
+        
+        # Configure repositories
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_tag_repo.get_by_id.return_value = category_tag
+        mock_tag_repo.update.return_value = category_tag
+        mock_tag_repo.cascade_deactivate_children.return_value = 2  # 2 children deactivated
+
+        # Act
+        await fight_service_with_tags.update_tag(fight_id, category_tag_id, "profight")
+        
+        # Assert: cascade_deactivate_children was called
+        mock_tag_repo.cascade_deactivate_children.assert_awaited_once_with(category_tag_id)
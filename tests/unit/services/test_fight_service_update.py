@@ -0,0 +1,67 @@
+"""
+Unit tests for FightService.update().
+
+Tests business logic layer for Fight operations with mocked repositories.
+"""
+
+import pytest
+
+from app.exceptions import (
+    FightNotFoundError,
+    ValidationError,
+)
+
+from tests.unit.services.support import fast_uuid
+
+
+class TestFightServiceUpdate:
+    """Test suite for fight update operations."""
+
+    @pytest.mark.asyncio
+    async def test_update_fight_location_succeeds(
+        self, fight_service, fight_factory, mock_fight_repo
+    ):
+        """
+        Test that updating fight location works correctly.
+        """
+        # Arrange
+        fight_id = fast_uuid()
+        fight = fight_factory(id=fight_id, location="Updated Location")
+
+        mock_fight_repo.get_by_id.return_value = fight
+        mock_fight_repo.update.return_value = fight
+
+        # Act
+        result = await fight_service.update(fight_id, {"location": "Updated Location"})
+
+        # Assert
+        assert result.location == "Updated Location"
+
+    @pytest.mark.asyncio
+    async def test_update_fight_rejects_empty_location(
+        self, fight_service, fight_factory, mock_fight_repo
+    ):
+        """
+        Test that updating fight with empty location raises ValidationError.
+        """
+        # Arrange
+        fight_id = fast_uuid()
+        fight = fight_factory(id=fight_id, location="Original")
+
+        mock_fight_repo.get_by_id.return_value = fight
+
+        # Act & Assert
+        with pytest.raises(ValidationError, match="Location cannot be empty"):
+            await fight_service.update(fight_id, {"location": ""})
+
+    @pytest.mark.asyncio
+    async def test_update_fight_handles_non_existent_fight(self, fight_service, mock_fight_repo):
+        """
+        Test that updating non-existent fight raises FightNotFoundError.
+        """
+        # Arrange
+        mock_fight_repo.get_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(FightNotFoundError):
+            await fight_service.update(fast_uuid(), {"location": "New"})
@@ -5,180 +5,119 @@ Tests business logic layer for Fighter operations with mocked repositories.
 Following TDD approach - these tests are written before implementation.
 """
 
+from contextlib import nullcontext
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
-from datetime import datetime, UTC
-from sqlalchemy.exc import IntegrityError
-
-# These imports will fail until implementation exists - that's expected in TDD
-from app.services.fighter_service import FighterService
-from app.repositories.fighter_repository import FighterRepository
-from app.repositories.team_repository import TeamRepository
-from app.models.fighter import Fighter
-from app.models.team import Team
-from app.models.country import Country
+from unittest.mock import call
+
 from app.exceptions import (
     FighterNotFoundError,
     InvalidTeamError,
     ValidationError
 )
 
+from tests.unit.services.support import fast_uuid
+
+
+# Team lookup outcomes for a fighter's team_id: (team_state, expected error message)
+_TEAM_STATES = [
+    pytest.param("active", None, id="team-active"),
+    pytest.param("missing", "Team not found", id="team-missing"),
+    pytest.param("deactivated", "Team is not active", id="team-deactivated"),
+]
+
+
+@pytest.fixture
+def team_state(request, mock_team_repo, team_factory):
+    """
+    Configure the team lookup for an indirectly parametrized team state.
+
+    "active": get_by_id returns an active team.
+    "missing": both lookups (active, then include_deactivated=True) return None.
+    "deactivated": the active lookup returns None, the second returns the
+    deactivated team.
+
+    Returns:
+        UUID: id of the team the test should reference
+    """
+    team_id = fast_uuid()
+    if request.param == "active":
+        mock_team_repo.get_by_id.return_value = team_factory(id=team_id)
+    elif request.param == "missing":
+        mock_team_repo.get_by_id.side_effect = [None, None]
+    else:
+        mock_team_repo.get_by_id.side_effect = [
+            None, team_factory(id=team_id, name="Defunct Team", is_deactivated=True)
+        ]
+    return team_id
+
 
 class TestFighterServiceCreate:
     """Test suite for fighter creation with validation."""
 
-    @pytest.mark.asyncio
-    async def test_create_fighter_with_valid_team_succeeds(self):
+    @pytest.mark.parametrize("team_state,match", _TEAM_STATES, indirect=["team_state"])
+    async def test_create_fighter_validates_team(
+        self, fighter_service, mock_fighter_repo, mock_team_repo, fighter_factory,
+        team_state, match
+    ):
         """
-        Test creating fighter with valid team succeeds.
+        Test creating fighter succeeds only when its team exists and is active.
 
-        Arrange: Mock repositories with active team
+        Arrange: Team lookup configured by team_state (active, missing, deactivated)
         Act: Call service.create()
-        Assert: Fighter created successfully
+        Assert: Fighter created for an active team; otherwise InvalidTeamError
+                with the matching message and nothing created
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        team_id = uuid4()
-        team = Team(
-            id=team_id,
-            name="Team USA",
-            country_id=uuid4(),
-            is_deactivated=False,
-            created_at=datetime.now(UTC)
-        )
-
-        fighter = Fighter(
-            id=uuid4(),
-            name="John Smith",
-            team_id=team_id,
-            is_deactivated=False,
-            created_at=datetime.now(UTC)
-        )
-
-        mock_team_repo.get_by_id.return_value = team
-        mock_fighter_repo.create.return_value = fighter
-
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
-        # Act
-        result = await service.create({"name": "John Smith", "team_id": team_id})
-
-        # Assert
-        assert result.name == "John Smith"
-        assert result.team_id == team_id
-        mock_team_repo.get_by_id.assert_awaited_once_with(team_id, include_deactivated=False)
-        mock_fighter_repo.create.assert_awaited_once()
-
-    @pytest.mark.asyncio
-    async def test_create_fighter_with_non_existent_team_raises_error(self):
-        """
-        Test creating fighter with non-existent team raises InvalidTeamError.
-
-        Arrange: Mock team repository returning None (team doesn't exist at all)
-        Act: Call service.create()
-        Assert: InvalidTeamError raised with "Team not found"
-        """
-        # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        team_id = uuid4()
-        # Service checks twice: first with include_deactivated=False, then with include_deactivated=True
-        mock_team_repo.get_by_id.side_effect = [None, None]  # Team doesn't exist at all
-
-        service = FighterService(mock_fighter_repo, mock_team_repo)
+        team_id = team_state
+        mock_fighter_repo.create.return_value = fighter_factory(name="John Smith", team_id=team_id)
+        succeeds = match is None
+        expectation = nullcontext() if succeeds else pytest.raises(InvalidTeamError, match=match)
 
         # Act & Assert
-        with pytest.raises(InvalidTeamError, match="Team not found"):
-            await service.create({"name": "John Smith", "team_id": team_id})
-
-        assert mock_team_repo.get_by_id.await_count == 2  # Checked twice
-        mock_fighter_repo.create.assert_not_awaited()
-
-    @pytest.mark.asyncio
-    async def test_create_fighter_with_soft_deleted_team_raises_error(self):
-        """
-        Test creating fighter with deactivated team raises InvalidTeamError.
-
-        Arrange: Mock team repository returning None (filtered) but exists when include_deactivated=True
-        Act: Call service.create()
-        Assert: InvalidTeamError raised with "Team is not active"
-        """
-        # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        team_id = uuid4()
-        deleted_team = Team(
-            id=team_id,
-            name="Defunct Team",
-            country_id=uuid4(),
-            is_deactivated=True,
-            created_at=datetime.now(UTC)
-        )
-
-        # First call (include_deactivated=False) returns None, second call (include_deactivated=True) returns deleted team
-        mock_team_repo.get_by_id.side_effect = [None, deleted_team]
-
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
-        # Act & Assert
-        with pytest.raises(InvalidTeamError, match="Team is not active"):
-            await service.create({"name": "John Smith", "team_id": team_id})
-
-        assert mock_team_repo.get_by_id.await_count == 2
-        mock_fighter_repo.create.assert_not_awaited()
-
-    @pytest.mark.asyncio
-    async def test_create_fighter_with_empty_name_raises_error(self):
-        """
-        Test creating fighter with empty name raises ValidationError.
+        with expectation:
+            result = await fighter_service.create({"name": "John Smith", "team_id": team_id})
+
+        if succeeds:
+            assert result.name == "John Smith"
+            assert result.team_id == team_id
+            assert mock_team_repo.get_by_id.await_args_list == [
+                call(team_id, include_deactivated=False)
+            ]
+        else:
+            # Checked twice: active first, then include_deactivated=True
+            assert mock_team_repo.get_by_id.await_count == 2
+        assert mock_fighter_repo.create.await_count == (1 if succeeds else 0)
+
+    @pytest.mark.parametrize("bad_name", [
+        pytest.param("", id="empty"),
+        pytest.param("   ", id="spaces"),
+        pytest.param("\t\n", id="tab-newline"),
+    ])
+    async def test_create_fighter_with_blank_name_raises_error(
+        self, fighter_service, mock_fighter_repo, mock_team_repo, bad_name
+    ):
+        """
+        Test creating fighter with an empty or whitespace-only name raises ValidationError.
 
         Arrange: Service with mocked repositories
-        Act: Call service.create() with empty name
-        Assert: ValidationError raised
+        Act: Call service.create() with blank name
+        Assert: ValidationError raised before any repository call
         """
-        # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act & Assert
         with pytest.raises(ValidationError, match="name is required"):
-            await service.create({"name": "", "team_id": uuid4()})
+            await fighter_service.create({"name": bad_name, "team_id": fast_uuid()})
 
-        mock_team_repo.get_by_id.assert_not_awaited()
-        mock_fighter_repo.create.assert_not_awaited()
-
-    @pytest.mark.asyncio
-    async def test_create_fighter_with_whitespace_name_raises_error(self):
-        """
-        Test creating fighter with whitespace-only name raises ValidationError.
-
-        Arrange: Service with mocked repositories
-        Act: Call service.create() with whitespace name
-        Assert: ValidationError raised
-        """
-        # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
-        # Act & Assert
-        with pytest.raises(ValidationError, match="name is required"):
-            await service.create({"name": "   ", "team_id": uuid4()})
+        assert mock_team_repo.get_by_id.await_count == 0
+        assert mock_fighter_repo.create.await_count == 0
 
 
 class TestFighterServiceRetrieve:
     """Test suite for fighter retrieval operations."""
 
-    @pytest.mark.asyncio
-    async def test_get_by_id_returns_fighter_when_exists(self):
+    async def test_get_by_id_returns_fighter_when_exists(
+        self, fighter_service, mock_fighter_repo, fighter_factory
+    ):
         """
         Test that get_by_id returns fighter when it exists.
 
@@ -187,31 +126,21 @@ class TestFighterServiceRetrieve:
         Assert: Returns fighter
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        fighter_id = uuid4()
-        fighter = Fighter(
-            id=fighter_id,
-            name="John Smith",
-            team_id=uuid4(),
-            is_deactivated=False,
-            created_at=datetime.now(UTC)
-        )
+        fighter_id = fast_uuid()
+        fighter = fighter_factory(id=fighter_id, name="John Smith")
 
         mock_fighter_repo.get_by_id.return_value = fighter
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act
-        result = await service.get_by_id(fighter_id)
+        result = await fighter_service.get_by_id(fighter_id)
 
         # Assert
         assert result.id == fighter_id
         mock_fighter_repo.get_by_id.assert_awaited_once_with(fighter_id, include_deactivated=False)
 
-    @pytest.mark.asyncio
-    async def test_get_by_id_raises_not_found_when_fighter_not_exists(self):
+    async def test_get_by_id_raises_not_found_when_fighter_not_exists(
+        self, fighter_service, mock_fighter_repo
+    ):
         """
         Test that get_by_id raises FighterNotFoundError when fighter doesn't exist.
 
@@ -220,19 +149,15 @@ class TestFighterServiceRetrieve:
         Assert: FighterNotFoundError raised
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
         mock_fighter_repo.get_by_id.return_value = None
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act & Assert
         with pytest.raises(FighterNotFoundError):
-            await service.get_by_id(uuid4())
+            await fighter_service.get_by_id(fast_uuid())
 
-    @pytest.mark.asyncio
-    async def test_list_all_returns_all_active_fighters(self):
+    async def test_list_all_returns_all_active_fighters(
+        self, fighter_service, mock_fighter_repo, fighter_factory
+    ):
         """
         Test that list_all returns all active fighters.
 
@@ -241,27 +166,24 @@ class TestFighterServiceRetrieve:
         Assert: Returns list of fighters
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
         fighters = [
-            Fighter(id=uuid4(), name="John Smith", team_id=uuid4(), is_deactivated=False, created_at=datetime.now(UTC)),
-            Fighter(id=uuid4(), name="Jane Doe", team_id=uuid4(), is_deactivated=False, created_at=datetime.now(UTC))
+            fighter_factory(name="John Smith"),
+            fighter_factory(name="Jane Doe")
         ]
 
         mock_fighter_repo.list_all.return_value = fighters
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act
-        result = await service.list_all()
+        result = await fighter_service.list_all()
 
         # Assert
         assert len(result) == 2
-        mock_fighter_repo.list_all.assert_awaited_once_with(include_deactivated=False)
+        assert mock_fighter_repo.list_all.await_count == 1
+        assert mock_fighter_repo.list_all.await_args == call(include_deactivated=False)
 
-    @pytest.mark.asyncio
-    async def test_list_by_team_returns_team_fighters(self):
+    async def test_list_by_team_returns_team_fighters(
+        self, fighter_service, mock_fighter_repo, fighter_factory
+    ):
         """
         Test that list_by_team returns fighters for specified team.
 
@@ -270,29 +192,26 @@ class TestFighterServiceRetrieve:
         Assert: Returns team's fighters
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        team_id = uuid4()
+        team_id = fast_uuid()
         fighters = [
-            Fighter(id=uuid4(), name="John Smith", team_id=team_id, is_deactivated=False, created_at=datetime.now(UTC)),
-            Fighter(id=uuid4(), name="Jane Doe", team_id=team_id, is_deactivated=False, created_at=datetime.now(UTC))
+            fighter_factory(name="John Smith", team_id=team_id),
+            fighter_factory(name="Jane Doe", team_id=team_id)
         ]
 
         mock_fighter_repo.list_by_team.return_value = fighters
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act
-        result = await service.list_by_team(team_id)
+        result = await fighter_service.list_by_team(team_id)
 
         # Assert
         assert len(result) == 2
         assert all(f.team_id == team_id for f in result)
-        mock_fighter_repo.list_by_team.assert_awaited_once_with(team_id, include_deactivated=False)
+        assert mock_fighter_repo.list_by_team.await_count == 1
+        assert mock_fighter_repo.list_by_team.await_args == call(team_id, include_deactivated=False)
 
-    @pytest.mark.asyncio
-    async def test_list_by_country_returns_country_fighters(self):
+    async def test_list_by_country_returns_country_fighters(
+        self, fighter_service, mock_fighter_repo, fighter_factory
+    ):
         """
         Test that list_by_country returns fighters from country's teams.
 
@@ -301,32 +220,29 @@ class TestFighterServiceRetrieve:
         Assert: Returns country's fighters
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        country_id = uuid4()
+        country_id = fast_uuid()
         fighters = [
-            Fighter(id=uuid4(), name="John Smith", team_id=uuid4(), is_deactivated=False, created_at=datetime.now(UTC)),
-            Fighter(id=uuid4(), name="Jane Doe", team_id=uuid4(), is_deactivated=False, created_at=datetime.now(UTC))
+            fighter_factory(name="John Smith"),
+            fighter_factory(name="Jane Doe")
         ]
 
         mock_fighter_repo.list_by_country.return_value = fighters
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act
-        result = await service.list_by_country(country_id)
+        result = await fighter_service.list_by_country(country_id)
 
         # Assert
         assert len(result) == 2
-        mock_fighter_repo.list_by_country.assert_awaited_once_with(country_id, include_deactivated=False)
+        assert mock_fighter_repo.list_by_country.await_count == 1
+        assert mock_fighter_repo.list_by_country.await_args == call(country_id, include_deactivated=False)
 
 
 class TestFighterServiceUpdate:
     """Test suite for fighter update operations."""
 
-    @pytest.mark.asyncio
-    async def test_update_fighter_name_succeeds(self):
+    async def test_update_fighter_name_succeeds(
+        self, fighter_service, mock_fighter_repo, fighter_factory
+    ):
         """
         Test that updating fighter name succeeds.
 
@@ -335,153 +251,75 @@ class TestFighterServiceUpdate:
         Assert: Fighter name updated
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        fighter_id = uuid4()
-        updated_fighter = Fighter(
-            id=fighter_id,
-            name="Jonathan Smith",
-            team_id=uuid4(),
-            is_deactivated=False,
-            created_at=datetime.now(UTC)
-        )
+        fighter_id = fast_uuid()
+        updated_fighter = fighter_factory(id=fighter_id, name="Jonathan Smith")
 
         mock_fighter_repo.update.return_value = updated_fighter
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act
-        result = await service.update(fighter_id, {"name": "Jonathan Smith"})
+        result = await fighter_service.update(fighter_id, {"name": "Jonathan Smith"})
 
         # Assert
         assert result.name == "Jonathan Smith"
         mock_fighter_repo.update.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_update_fighter_team_validates_new_team_exists(self):
-        """
-        Test that updating fighter team validates new team exists.
-
-        Arrange: Mock repositories with valid new team
-        Act: Call service.update() with new team_id
-        Assert: Team validated, fighter updated
-        """
-        # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        fighter_id = uuid4()
-        new_team_id = uuid4()
-
-        new_team = Team(
-            id=new_team_id,
-            name="New Team",
-            country_id=uuid4(),
-            is_deactivated=False,
-            created_at=datetime.now(UTC)
-        )
-
-        updated_fighter = Fighter(
-            id=fighter_id,
-            name="John Smith",
-            team_id=new_team_id,
-            is_deactivated=False,
-            created_at=datetime.now(UTC)
-        )
-
-        mock_team_repo.get_by_id.return_value = new_team
-        mock_fighter_repo.update.return_value = updated_fighter
-
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
-        # Act
-        result = await service.update(fighter_id, {"team_id": new_team_id})
-
-        # Assert
-        assert result.team_id == new_team_id
-        mock_team_repo.get_by_id.assert_awaited_once_with(new_team_id, include_deactivated=False)
-        mock_fighter_repo.update.assert_awaited_once()
-
-    @pytest.mark.asyncio
-    async def test_update_fighter_team_to_non_existent_team_raises_error(self):
+    @pytest.mark.parametrize("team_state,match", _TEAM_STATES, indirect=["team_state"])
+    async def test_update_fighter_team_validates_new_team(
+        self, fighter_service, mock_fighter_repo, mock_team_repo, fighter_factory,
+        team_state, match
+    ):
         """
-        Test that updating to non-existent team raises InvalidTeamError.
+        Test that moving a fighter to another team requires that team to be active.
 
-        Arrange: Mock team repository returning None
-        Act: Call service.update() with non-existent team
-        Assert: InvalidTeamError raised
+        Arrange: New team lookup configured by team_state (active, missing, deactivated)
+        Act: Call service.update() with the new team_id
+        Assert: Fighter updated for an active team; otherwise InvalidTeamError
+                with the matching message and no update
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        new_team_id = uuid4()
-        mock_team_repo.get_by_id.return_value = None
-
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
-        # Act & Assert
-        with pytest.raises(InvalidTeamError, match="Team not found"):
-            await service.update(uuid4(), {"team_id": new_team_id})
-
-        mock_fighter_repo.update.assert_not_awaited()
-
-    @pytest.mark.asyncio
-    async def test_update_fighter_team_to_soft_deleted_team_raises_error(self):
-        """
-        Test that updating to deactivated team raises InvalidTeamError.
-
-        Arrange: Mock team repository with deactivated team
-        Act: Call service.update()
-        Assert: InvalidTeamError raised
-        """
-        # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        new_team_id = uuid4()
-        deleted_team = Team(
-            id=new_team_id,
-            name="Defunct Team",
-            country_id=uuid4(),
-            is_deactivated=True,
-            created_at=datetime.now(UTC)
+        fighter_id = fast_uuid()
+        new_team_id = team_state
+        mock_fighter_repo.update.return_value = fighter_factory(
+            id=fighter_id, name="John Smith", team_id=new_team_id
         )
-
-        mock_team_repo.get_by_id.side_effect = [None, deleted_team]
-
-        service = FighterService(mock_fighter_repo, mock_team_repo)
+        succeeds = match is None
+        expectation = nullcontext() if succeeds else pytest.raises(InvalidTeamError, match=match)
 
         # Act & Assert
-        with pytest.raises(InvalidTeamError, match="Team is not active"):
-            await service.update(uuid4(), {"team_id": new_team_id})
-
-        mock_fighter_repo.update.assert_not_awaited()
-
-    @pytest.mark.asyncio
-    async def test_update_fighter_with_empty_name_raises_error(self):
-        """
-        Test that updating with empty name raises ValidationError.
+        with expectation:
+            result = await fighter_service.update(fighter_id, {"team_id": new_team_id})
+
+        if succeeds:
+            assert result.team_id == new_team_id
+            assert mock_team_repo.get_by_id.await_args_list == [
+                call(new_team_id, include_deactivated=False)
+            ]
+        assert mock_fighter_repo.update.await_count == (1 if succeeds else 0)
+
+    @pytest.mark.parametrize("bad_name", [
+        pytest.param("", id="empty"),
+        pytest.param("   ", id="spaces"),
+        pytest.param("\t\n", id="tab-newline"),
+    ])
+    async def test_update_fighter_with_blank_name_raises_error(
+        self, fighter_service, mock_fighter_repo, bad_name
+    ):
+        """
+        Test that updating with an empty or whitespace-only name raises ValidationError.
 
         Arrange: Service with mocked repositories
-        Act: Call service.update() with empty name
+        Act: Call service.update() with blank name
         Assert: ValidationError raised
         """
-        # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act & Assert
         with pytest.raises(ValidationError, match="name is required"):
-            await service.update(uuid4(), {"name": ""})
+            await fighter_service.update(fast_uuid(), {"name": bad_name})
 
-        mock_fighter_repo.update.assert_not_awaited()
+        assert mock_fighter_repo.update.await_count == 0
 
-    @pytest.mark.asyncio
-    async def test_update_non_existent_fighter_raises_error(self):
+    async def test_update_non_existent_fighter_raises_error(
+        self, fighter_service, mock_fighter_repo
+    ):
         """
         Test that updating non-existent fighter raises FighterNotFoundError.
 
@@ -490,23 +328,17 @@ class TestFighterServiceUpdate:
         Assert: FighterNotFoundError raised
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
         mock_fighter_repo.update.side_effect = ValueError("Fighter not found")
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act & Assert
         with pytest.raises(FighterNotFoundError):
-            await service.update(uuid4(), {"name": "New Name"})
+            await fighter_service.update(fast_uuid(), {"name": "New Name"})
 
 
 class TestFighterServiceDeactivate:
     """Test suite for fighter deactivation operations."""
 
-    @pytest.mark.asyncio
-    async def test_deactivate_fighter_succeeds(self):
+    async def test_deactivate_fighter_succeeds(self, fighter_service, mock_fighter_repo):
         """
         Test that deactivating fighter succeeds.
 
@@ -515,22 +347,18 @@ class TestFighterServiceDeactivate:
         Assert: Fighter deactivated
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
-        fighter_id = uuid4()
+        fighter_id = fast_uuid()
         mock_fighter_repo.deactivate.return_value = None
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act
-        await service.deactivate(fighter_id)
+        await fighter_service.deactivate(fighter_id)
 
         # Assert
         mock_fighter_repo.deactivate.assert_awaited_once_with(fighter_id)
 
-    @pytest.mark.asyncio
-    async def test_deactivate_non_existent_fighter_raises_error(self):
+    async def test_deactivate_non_existent_fighter_raises_error(
+        self, fighter_service, mock_fighter_repo
+    ):
         """
         Test that deactivating non-existent fighter raises FighterNotFoundError.
 
@@ -539,23 +367,17 @@ class TestFighterServiceDeactivate:
         Assert: FighterNotFoundError raised
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
-
         mock_fighter_repo.deactivate.side_effect = ValueError("Fighter not found")
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act & Assert
         with pytest.raises(FighterNotFoundError):
-            await service.deactivate(uuid4())
+            await fighter_service.deactivate(fast_uuid())
 
 
 class TestFighterServicePermanentDelete:
     """Test suite for fighter permanent delete business logic."""
 
-    @pytest.mark.asyncio
-    async def test_delete_fighter_delegates_to_repository(self):
+    async def test_delete_fighter_delegates_to_repository(self, fighter_service, mock_fighter_repo):
         """
         Test that delete calls repository.delete() and succeeds.
 
@@ -564,21 +386,19 @@ class TestFighterServicePermanentDelete:
         Assert: Repository delete called with correct ID
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
         mock_fighter_repo.delete.return_value = None
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-        fighter_id = uuid4()
+        fighter_id = fast_uuid()
 
         # Act
-        await service.delete(fighter_id)
+        await fighter_service.delete(fighter_id)
 
         # Assert
         mock_fighter_repo.delete.assert_awaited_once_with(fighter_id)
 
-    @pytest.mark.asyncio
-    async def test_delete_non_existent_fighter_raises_error(self):
+    async def test_delete_non_existent_fighter_raises_error(
+        self, fighter_service, mock_fighter_repo
+    ):
         """
         Test that deleting non-existent fighter raises FighterNotFoundError.
 
@@ -587,12 +407,8 @@ class TestFighterServicePermanentDelete:
         Assert: FighterNotFoundError raised
         """
         # Arrange
-        mock_fighter_repo = AsyncMock(spec=FighterRepository)
-        mock_team_repo = AsyncMock(spec=TeamRepository)
         mock_fighter_repo.delete.side_effect = ValueError("Fighter not found")
 
-        service = FighterService(mock_fighter_repo, mock_team_repo)
-
         # Act & Assert
         with pytest.raises(FighterNotFoundError):
-            await service.delete(uuid4())
+            await fighter_service.delete(fast_uuid())
@@ -0,0 +1,69 @@
+"""
+Contract tests for the repository stubs in stubs.py.
+
+The service tests use Fake*Repo stubs instead of AsyncMock(spec=...), so
+these tests keep the spec guarantee: every stub declares exactly the public
+async methods of the repository it stands in for, and rejects anything else.
+"""
+
+import inspect
+
+import pytest
+
+from app.repositories.country_repository import CountryRepository
+from app.repositories.fight_participation_repository import FightParticipationRepository
+from app.repositories.fight_repository import FightRepository
+from app.repositories.fighter_repository import FighterRepository
+from app.repositories.tag_repository import TagRepository
+from app.repositories.tag_type_repository import TagTypeRepository
+from app.repositories.team_repository import TeamRepository
+
+from tests.unit.services.stubs import (
+    FakeCountryRepo,
+    FakeFightRepo,
+    FakeFighterRepo,
+    FakeParticipationRepo,
+    FakeTagRepo,
+    FakeTagTypeRepo,
+    FakeTeamRepo,
+)
+
+_STUBBED_REPOSITORIES = [
+    pytest.param(FakeFightRepo, FightRepository, id="fight"),
+    pytest.param(FakeParticipationRepo, FightParticipationRepository, id="participation"),
+    pytest.param(FakeFighterRepo, FighterRepository, id="fighter"),
+    pytest.param(FakeTeamRepo, TeamRepository, id="team"),
+    pytest.param(FakeCountryRepo, CountryRepository, id="country"),
+    pytest.param(FakeTagRepo, TagRepository, id="tag"),
+    pytest.param(FakeTagTypeRepo, TagTypeRepository, id="tag_type"),
+]
+
+
+@pytest.mark.parametrize("stub_cls,repository_cls", _STUBBED_REPOSITORIES)
+def test_stub_declares_repository_methods(stub_cls, repository_cls):
+    """
+    Test that a stub declares exactly the repository's public async methods.
+
+    Assert: Adding, renaming or removing a repository method fails here
+            until the stub is updated to match
+    """
+    repository_methods = {
+        name for name, _ in inspect.getmembers(repository_cls, inspect.iscoroutinefunction)
+        if not name.startswith("_")
+    }
+
+    assert set(stub_cls.methods) == repository_methods
+
+
+def test_stub_rejects_undeclared_attributes():
+    """
+    Test that a stub raises AttributeError for names its repository lacks.
+
+    Assert: Both reading and assigning an undeclared method fail, as with spec_set
+    """
+    stub = FakeTeamRepo()
+
+    with pytest.raises(AttributeError):
+        stub.soft_delete
+    with pytest.raises(AttributeError):
+        stub.soft_delete = None
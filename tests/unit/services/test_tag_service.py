@@ -6,22 +6,19 @@ Following STRICT TDD - ONE test at a time, RED → GREEN → REFACTOR.
 """
 
 import pytest
-from unittest.mock import AsyncMock
-from uuid import uuid4
 
-from app.repositories.tag_repository import TagRepository
-from app.repositories.tag_type_repository import TagTypeRepository
-from app.services.tag_service import TagService
-from app.models.tag import Tag
 from app.models.tag_type import TagType
 from app.exceptions import ValidationError
 
+from tests.unit.services.support import fast_uuid
+
 
 class TestTagServiceCreate:
     """Test suite for tag creation with strict TDD."""
 
-    @pytest.mark.asyncio
-    async def test_create_tag_validates_tag_type_exists(self):
+    async def test_create_tag_validates_tag_type_exists(
+        self, tag_service, mock_tag_repo, mock_tag_type_repo
+    ):
         """
         Test that creating a tag validates tag_type_id exists.
 
@@ -32,18 +29,10 @@ class TestTagServiceCreate:
         Assert: ValidationError raised with appropriate message
         """
         # Arrange
-        mock_tag_repo = AsyncMock(spec=TagRepository)
-        mock_tag_type_repo = AsyncMock(spec=TagTypeRepository)
-
         # Tag type does NOT exist
         mock_tag_type_repo.get_by_id.return_value = None
 
-        service = TagService(
-            tag_repository=mock_tag_repo,
-            tag_type_repository=mock_tag_type_repo
-        )
-
-        tag_type_id = uuid4()
+        tag_type_id = fast_uuid()
         tag_data = {
             'tag_type_id': tag_type_id,
             'value': 'singles'
@@ -51,15 +40,16 @@ class TestTagServiceCreate:
 
         # Act & Assert
         with pytest.raises(ValidationError) as exc_info:
-            await service.create(tag_data)
+            await tag_service.create(tag_data)
 
         assert 'tag type' in str(exc_info.value).lower()
         assert 'not found' in str(exc_info.value).lower()
         mock_tag_type_repo.get_by_id.assert_called_once_with(tag_type_id)
         mock_tag_repo.create.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_create_tag_with_valid_tag_type_succeeds(self):
+    async def test_create_tag_with_valid_tag_type_succeeds(
+        self, tag_service, mock_tag_repo, mock_tag_type_repo, tag_factory
+    ):
         """
         Test that creating a tag with valid tag_type_id succeeds.
 
@@ -70,33 +60,21 @@ class TestTagServiceCreate:
         Assert: Tag created successfully
         """
         # Arrange
-        mock_tag_repo = AsyncMock(spec=TagRepository)
-        mock_tag_type_repo = AsyncMock(spec=TagTypeRepository)
-
         # Tag type EXISTS
-        tag_type_id = uuid4()
+        tag_type_id = fast_uuid()
         tag_type = TagType(id=tag_type_id, name='fight_format')
         mock_tag_type_repo.get_by_id.return_value = tag_type
 
-        created_tag = Tag(
-            id=uuid4(),
-            tag_type_id=tag_type_id,
-            value='singles'
-        )
+        created_tag = tag_factory(tag_type_id=tag_type_id, value='singles')
         mock_tag_repo.create.return_value = created_tag
 
-        service = TagService(
-            tag_repository=mock_tag_repo,
-            tag_type_repository=mock_tag_type_repo
-        )
-
         tag_data = {
             'tag_type_id': tag_type_id,
             'value': 'singles'
         }
 
         # Act
-        result = await service.create(tag_data)
+        result = await tag_service.create(tag_data)
 
         # Assert
         assert result.value == 'singles'
@@ -108,8 +86,7 @@ class TestTagServiceCreate:
 class TestTagServiceGetById:
     """Test suite for tag retrieval by ID with strict TDD."""
 
-    @pytest.mark.asyncio
-    async def test_get_by_id_returns_tag_when_exists(self):
+    async def test_get_by_id_returns_tag_when_exists(self, tag_service, mock_tag_repo, tag_factory):
         """
         Test that get_by_id returns tag when it exists.
 
@@ -118,25 +95,13 @@ class TestTagServiceGetById:
         Assert: Tag returned successfully
         """
         # Arrange
-        mock_tag_repo = AsyncMock(spec=TagRepository)
-        mock_tag_type_repo = AsyncMock(spec=TagTypeRepository)
-
-        tag_id = uuid4()
-        tag_type_id = uuid4()
-        expected_tag = Tag(
-            id=tag_id,
-            tag_type_id=tag_type_id,
-            value='singles'
-        )
+        tag_id = fast_uuid()
+        tag_type_id = fast_uuid()
+        expected_tag = tag_factory(id=tag_id, tag_type_id=tag_type_id, value='singles')
         mock_tag_repo.get_by_id.return_value = expected_tag
 
-        service = TagService(
-            tag_repository=mock_tag_repo,
-            tag_type_repository=mock_tag_type_repo
-        )
-
         # Act
-        result = await service.get_by_id(tag_id)
+        result = await tag_service.get_by_id(tag_id)
 
         # Assert
         assert result is not None
@@ -148,8 +113,7 @@ class TestTagServiceGetById:
 class TestTagServiceListAll:
     """Test suite for listing all tags."""
 
-    @pytest.mark.asyncio
-    async def test_list_all_returns_all_tags(self):
+    async def test_list_all_returns_all_tags(self, tag_service, mock_tag_repo, tag_factory):
         """
         Test that list_all returns all non-deleted tags.
 
@@ -158,36 +122,27 @@ class TestTagServiceListAll:
         Assert: All tags returned
         """
         # Arrange
-        mock_tag_repo = AsyncMock(spec=TagRepository)
-        mock_tag_type_repo = AsyncMock(spec=TagTypeRepository)
-
-        tag_type_id = uuid4()
+        tag_type_id = fast_uuid()
         tags = [
-            Tag(id=uuid4(), tag_type_id=tag_type_id, value='singles'),
-            Tag(id=uuid4(), tag_type_id=tag_type_id, value='melee'),
+            tag_factory(tag_type_id=tag_type_id, value='singles'),
+            tag_factory(tag_type_id=tag_type_id, value='melee'),
         ]
         mock_tag_repo.list_all.return_value = tags
 
-        service = TagService(
-            tag_repository=mock_tag_repo,
-            tag_type_repository=mock_tag_type_repo
-        )
-
         # Act
-        result = await service.list_all()
+        result = await tag_service.list_all()
 
         # Assert
         assert len(result) == 2
         assert result[0].value == 'singles'
         assert result[1].value == 'melee'
-        mock_tag_repo.list_all.assert_called_once()
+        assert mock_tag_repo.list_all.await_count == 1
 
 
 class TestTagServiceUpdate:
     """Test suite for updating tags."""
 
-    @pytest.mark.asyncio
-    async def test_update_tag_value_succeeds(self):
+    async def test_update_tag_value_succeeds(self, tag_service, mock_tag_repo, tag_factory):
         """
         Test that updating tag value succeeds.
 
@@ -196,21 +151,13 @@ class TestTagServiceUpdate:
         Assert: Tag updated successfully
         """
         # Arrange
-        mock_tag_repo = AsyncMock(spec=TagRepository)
-        mock_tag_type_repo = AsyncMock(spec=TagTypeRepository)
-
-        tag_id = uuid4()
-        tag_type_id = uuid4()
-        updated_tag = Tag(id=tag_id, tag_type_id=tag_type_id, value='profight')
+        tag_id = fast_uuid()
+        tag_type_id = fast_uuid()
+        updated_tag = tag_factory(id=tag_id, tag_type_id=tag_type_id, value='profight')
         mock_tag_repo.update.return_value = updated_tag
 
-        service = TagService(
-            tag_repository=mock_tag_repo,
-            tag_type_repository=mock_tag_type_repo
-        )
-
         # Act
-        result = await service.update(tag_id, {'value': 'profight'})
+        result = await tag_service.update(tag_id, {'value': 'profight'})
         if result is None:
             pytest.fail("Expected updated tag, got None")
 
@@ -222,8 +169,7 @@ class TestTagServiceUpdate:
 class TestTagServiceDeactivate:
     """Test suite for deactivating tags."""
 
-    @pytest.mark.asyncio
-    async def test_deactivate_tag_calls_repository(self):
+    async def test_deactivate_tag_calls_repository(self, tag_service, mock_tag_repo):
         """
         Test that deactivate calls repository deactivate.
 
@@ -232,18 +178,10 @@ class TestTagServiceDeactivate:
         Assert: Repository deactivate called
         """
         # Arrange
-        mock_tag_repo = AsyncMock(spec=TagRepository)
-        mock_tag_type_repo = AsyncMock(spec=TagTypeRepository)
-
-        tag_id = uuid4()
-
-        service = TagService(
-            tag_repository=mock_tag_repo,
-            tag_type_repository=mock_tag_type_repo
-        )
+        tag_id = fast_uuid()
 
         # Act
-        await service.deactivate(tag_id)
+        await tag_service.deactivate(tag_id)
 
         # Assert
         mock_tag_repo.deactivate.assert_called_once_with(tag_id)
@@ -252,8 +190,7 @@ class TestTagServiceDeactivate:
 class TestTagServicePermanentDelete:
     """Test suite for Tag permanent delete business logic."""
 
-    @pytest.mark.asyncio
-    async def test_delete_tag_delegates_to_repository(self):
+    async def test_delete_tag_delegates_to_repository(self, tag_service, mock_tag_repo):
         """
         Test that delete calls repository.delete() and succeeds.
 
@@ -262,24 +199,17 @@ class TestTagServicePermanentDelete:
         Assert: Repository delete called with correct ID
         """
         # Arrange
-        mock_tag_repo = AsyncMock(spec=TagRepository)
-        mock_tag_type_repo = AsyncMock(spec=TagTypeRepository)
         mock_tag_repo.delete.return_value = None
 
-        service = TagService(
-            tag_repository=mock_tag_repo,
-            tag_type_repository=mock_tag_type_repo
-        )
-        tag_id = uuid4()
+        tag_id = fast_uuid()
 
         # Act
-        await service.delete(tag_id)
+        await tag_service.delete(tag_id)
 
         # Assert
         mock_tag_repo.delete.assert_awaited_once_with(tag_id)
 
-    @pytest.mark.asyncio
-    async def test_delete_non_existent_tag_raises_error(self):
+    async def test_delete_non_existent_tag_raises_error(self, tag_service, mock_tag_repo):
         """
         Test that deleting non-existent tag raises an appropriate error.
 
@@ -289,15 +219,8 @@ class TestTagServicePermanentDelete:
         """
         # Arrange
         from app.exceptions import TagNotFoundError
-        mock_tag_repo = AsyncMock(spec=TagRepository)
-        mock_tag_type_repo = AsyncMock(spec=TagTypeRepository)
         mock_tag_repo.delete.side_effect = ValueError("Tag not found")
 
-        service = TagService(
-            tag_repository=mock_tag_repo,
-            tag_type_repository=mock_tag_type_repo
-        )
-
         # Act & Assert
         with pytest.raises(TagNotFoundError):
-            await service.delete(uuid4())
+            await tag_service.delete(fast_uuid())
@@ -1,15 +1,45 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from app.repositories.tag_type_repository import TagTypeRepository
-from app.services.tag_type_service import TagTypeService
 from app.models.tag_type import TagType
+from app.exceptions import ValidationError
+
+# 51 characters exceeds the 50 char limit from the model
+_LONG_NAME = 'a' * 51
+
+_TEST_ID = UUID('123e4567-e89b-12d3-a456-426614174000')
+_LEAGUE_ID = UUID('123e4567-e89b-12d3-a456-426614174001')
+_UUID_A = UUID('00000000-0000-0000-0000-000000000001')
+_UUID_B = UUID('00000000-0000-0000-0000-000000000002')
+_UUID_C = UUID('00000000-0000-0000-0000-000000000003')
+
+
+@pytest.fixture
+def sample_tag_type():
+    """
+    Sample 'Test Tag Type' TagType.
+
+    Returns:
+        TagType: Fresh tag type instance per test
+    """
+    return TagType(id=_TEST_ID, name='Test Tag Type')
+
+
+@pytest.fixture
+def league_tag_type():
+    """
+    Sample 'league' TagType.
+
+    Returns:
+        TagType: Fresh tag type instance per test
+    """
+    return TagType(id=_LEAGUE_ID, name='league')
+
 
 class TestTagTypeService:
 
     @pytest.mark.asyncio
-    async def test_create_tag_type(self):
+    async def test_create_tag_type(self, tag_type_service, mock_tag_type_repo, sample_tag_type):
         """
         Test the creation of a tag type.
 
@@ -19,13 +49,9 @@ class TestTagTypeService:
         """
 
         #arrange
-        mock_tag_type_repository = AsyncMock(spec=TagTypeRepository)
-        tag_type_service = TagTypeService(tag_type_repository=mock_tag_type_repository)
-        tag_type = TagType(id='123e4567-e89b-12d3-a456-426614174000', name='Test Tag Type')
-
         # Mock get_by_name to return None (no duplicate)
-        mock_tag_type_repository.get_by_name.return_value = None
-        mock_tag_type_repository.create.return_value = tag_type
+        mock_tag_type_repo.get_by_name.return_value = None
+        mock_tag_type_repo.create.return_value = sample_tag_type
 
         tag_type_data = {'name': 'Test Tag Type'}
 
@@ -33,12 +59,12 @@ class TestTagTypeService:
         created_tag_type = await tag_type_service.create(tag_type_data)
 
         #assert
-        mock_tag_type_repository.get_by_name.assert_called_once_with('Test Tag Type')
-        mock_tag_type_repository.create.assert_called_once()
-        assert created_tag_type.name == 'Test Tag Type'
+        mock_tag_type_repo.get_by_name.assert_called_once_with('Test Tag Type')
+        mock_tag_type_repo.create.assert_called_once()
+        assert created_tag_type is sample_tag_type
 
     @pytest.mark.asyncio
-    async def test_get_tag_type(self):
+    async def test_get_tag_type(self, tag_type_service, mock_tag_type_repo, sample_tag_type):
         """
         Test retrieving a tag type by ID.
 
@@ -48,29 +74,19 @@ class TestTagTypeService:
         """
 
         #arrange
-        mock_tag_type_repository = AsyncMock(spec=TagTypeRepository)
-        tag_type_service = TagTypeService(tag_type_repository=mock_tag_type_repository)
-        tag_type_id = UUID('123e4567-e89b-12d3-a456-426614174000')
-        tag_type = TagType(id=tag_type_id, name='Test Tag Type')
-        mock_tag_type_repository.get_by_id.return_value = tag_type
+        tag_type_id = sample_tag_type.id
+        mock_tag_type_repo.get_by_id.return_value = sample_tag_type
 
         #act
         retrieved_tag_type = await tag_type_service.get_by_id(tag_type_id)
-        if retrieved_tag_type is None:
-            raise AssertionError("Tag type not found")
-        else:
-            result_id = retrieved_tag_type.id
-            
-            
 
         #assert
-        mock_tag_type_repository.get_by_id.assert_called_once_with(tag_type_id)
-        assert result_id == tag_type_id
-        assert retrieved_tag_type.name == 'Test Tag Type'
+        mock_tag_type_repo.get_by_id.assert_called_once_with(tag_type_id)
+        assert retrieved_tag_type is sample_tag_type
 
 
     @pytest.mark.asyncio
-    async def test_update_tag_type(self):
+    async def test_update_tag_type(self, tag_type_service, mock_tag_type_repo):
         """
         Test updating a tag type.
         Arrange: Set up the necessary mock objects and the service instance.
@@ -78,16 +94,13 @@ class TestTagTypeService:
         Assert: Verify that the tag type was updated successfully.
         """
         #arrange
-        mock_tag_type_repository = AsyncMock(spec=TagTypeRepository)
-        tag_type_service = TagTypeService(tag_type_repository=mock_tag_type_repository)
-
-        tag_type_id = UUID('123e4567-e89b-12d3-a456-426614174000')
+        tag_type_id = _TEST_ID
         existing_tag_type = TagType(id=tag_type_id, name='Original Tag Type')
         updated_tag_type = TagType(id=tag_type_id, name='Updated Tag Type')
 
-        mock_tag_type_repository.get_by_id.return_value = existing_tag_type
-        mock_tag_type_repository.get_by_name.return_value = None  # no duplicate
-        mock_tag_type_repository.update.return_value = updated_tag_type
+        mock_tag_type_repo.get_by_id.return_value = existing_tag_type
+        mock_tag_type_repo.get_by_name.return_value = None  # no duplicate
+        mock_tag_type_repo.update.return_value = updated_tag_type
 
         tag_type_data = {'name': 'Updated Tag Type'}
 
@@ -95,90 +108,43 @@ class TestTagTypeService:
         result = await tag_type_service.update(tag_type_id, tag_type_data)
 
         #assert
-        mock_tag_type_repository.update.assert_called_once_with(tag_type_id, tag_type_data)
-        assert result.name == 'Updated Tag Type'
+        mock_tag_type_repo.update.assert_called_once_with(tag_type_id, tag_type_data)
+        assert result is updated_tag_type
 
     @pytest.mark.asyncio
-    async def test_create_tag_type_with_duplicate_name_raises_error(self):
-        """
-        Test that creating a tag type with duplicate name raises ValidationError.
-
-        Arrange: Mock repository to return existing tag type with same name
-        Act: Call create with duplicate name
-        Assert: ValidationError raised with appropriate message
+    @pytest.mark.parametrize("name,name_taken,expected_sub", [
+        pytest.param('category', True, 'exists', id="duplicate"),
+        pytest.param('   ', False, 'required', id="whitespace-only"),
+        pytest.param(_LONG_NAME, False, 'exceed', id="too-long"),
+    ])
+    async def test_create_tag_type_with_invalid_name_raises_error(
+        self, tag_type_service, mock_tag_type_repo, name, name_taken, expected_sub
+    ):
+        """
+        Test that creating a tag type with a duplicate, blank or too long name
+        raises ValidationError.
+
+        Arrange: Mock repository; get_by_name returns an existing tag type
+                 only for the duplicate case
+        Act: Call create with the invalid name
+        Assert: ValidationError raised with the matching message, nothing created
         """
         # Arrange
-        mock_tag_type_repository = AsyncMock(spec=TagTypeRepository)
-        tag_type_service = TagTypeService(tag_type_repository=mock_tag_type_repository)
-
-        # Mock repository to return existing tag type (indicates duplicate)
-        existing_tag_type = TagType(
-            id='123e4567-e89b-12d3-a456-426614174000',
-            name='category'
+        mock_tag_type_repo.get_by_name.return_value = (
+            TagType(id=_TEST_ID, name=name) if name_taken else None
         )
-        mock_tag_type_repository.get_by_name.return_value = existing_tag_type
-
-        tag_type_data = {'name': 'category'}
 
         # Act & Assert
-        from app.exceptions import ValidationError
         with pytest.raises(ValidationError) as exc_info:
-            await tag_type_service.create(tag_type_data)
+            await tag_type_service.create({'name': name})
 
-        assert 'unique' in str(exc_info.value).lower() or 'exists' in str(exc_info.value).lower()
-        mock_tag_type_repository.get_by_name.assert_called_once_with('category')
-        mock_tag_type_repository.create.assert_not_called()
+        assert expected_sub in str(exc_info.value).lower()
+        if name_taken:
+            mock_tag_type_repo.get_by_name.assert_called_once_with(name)
+        mock_tag_type_repo.create.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_create_tag_type_with_empty_name_raises_error(self):
-        """
-        Test that creating a tag type with empty name raises ValidationError.
-
-        Arrange: Mock repository
-        Act: Call create with empty name
-        Assert: ValidationError raised
-        """
-        # Arrange
-        mock_tag_type_repository = AsyncMock(spec=TagTypeRepository)
-        tag_type_service = TagTypeService(tag_type_repository=mock_tag_type_repository)
-
-        tag_type_data = {'name': '   '}  # Whitespace only
-
-        # Act & Assert
-        from app.exceptions import ValidationError
-        with pytest.raises(ValidationError) as exc_info:
-            await tag_type_service.create(tag_type_data)
-
-        assert 'required' in str(exc_info.value).lower()
-        mock_tag_type_repository.create.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_create_tag_type_with_name_too_long_raises_error(self):
-        """
-        Test that creating a tag type with name exceeding max length raises ValidationError.
-
-        Arrange: Mock repository
-        Act: Call create with name > 50 characters
-        Assert: ValidationError raised
-        """
-        # Arrange
-        mock_tag_type_repository = AsyncMock(spec=TagTypeRepository)
-        tag_type_service = TagTypeService(tag_type_repository=mock_tag_type_repository)
-
-        # Name with 51 characters (exceeds 50 char limit from model)
-        long_name = 'a' * 51
-        tag_type_data = {'name': long_name}
-
-        # Act & Assert
-        from app.exceptions import ValidationError
-        with pytest.raises(ValidationError) as exc_info:
-            await tag_type_service.create(tag_type_data)
-
-        assert 'exceed' in str(exc_info.value).lower() or 'long' in str(exc_info.value).lower()
-        mock_tag_type_repository.create.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_list_all_tag_types(self):
+    async def test_list_all_tag_types(self, tag_type_service, mock_tag_type_repo):
         """
         Test retrieving all tag types.
 
@@ -187,28 +153,22 @@ class TestTagTypeService:
         Assert: Returns all tag types from repository
         """
         # Arrange
-        mock_tag_type_repository = AsyncMock(spec=TagTypeRepository)
-        tag_type_service = TagTypeService(tag_type_repository=mock_tag_type_repository)
-
         tag_types = [
-            TagType(id=uuid4(), name='fight_format', display_order=1),
-            TagType(id=uuid4(), name='category', display_order=2),
-            TagType(id=uuid4(), name='weapon', display_order=3)
+            TagType(id=_UUID_A, name='fight_format', display_order=1),
+            TagType(id=_UUID_B, name='category', display_order=2),
+            TagType(id=_UUID_C, name='weapon', display_order=3)
         ]
-        mock_tag_type_repository.list_all.return_value = tag_types
+        mock_tag_type_repo.list_all.return_value = tag_types
 
         # Act
         result = await tag_type_service.list_all()
 
         # Assert
-        assert len(result) == 3
-        assert result[0].name == 'fight_format'
-        assert result[1].name == 'category'
-        assert result[2].name == 'weapon'
-        mock_tag_type_repository.list_all.assert_called_once()
+        assert result is tag_types
+        mock_tag_type_repo.list_all.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_update_nonexistent_tag_type_raises_error(self):
+    async def test_update_nonexistent_tag_type_raises_error(self, tag_type_service, mock_tag_type_repo):
         """
         Test that updating a nonexistent tag type raises error.
 
@@ -217,24 +177,20 @@ class TestTagTypeService:
         Assert: Raises appropriate error
         """
         # Arrange
-        mock_tag_type_repository = AsyncMock(spec=TagTypeRepository)
-        tag_type_service = TagTypeService(tag_type_repository=mock_tag_type_repository)
-
-        tag_type_id = UUID('123e4567-e89b-12d3-a456-426614174000')
-        mock_tag_type_repository.get_by_id.return_value = None
+        tag_type_id = _TEST_ID
+        mock_tag_type_repo.get_by_id.return_value = None
 
         update_data = {'display_order': 10}
 
         # Act & Assert
-        from app.exceptions import ValidationError
         with pytest.raises(ValidationError) as exc_info:
             await tag_type_service.update(tag_type_id, update_data)
 
         assert 'not found' in str(exc_info.value).lower()
-        mock_tag_type_repository.update.assert_not_called()
+        mock_tag_type_repo.update.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_deactivate_tag_type(self):
+    async def test_deactivate_tag_type(self, tag_type_service, mock_tag_type_repo, league_tag_type):
         """
         Test deactivating a tag type.
 
@@ -243,22 +199,18 @@ class TestTagTypeService:
         Assert: Repository deactivate called
         """
         # Arrange
-        mock_tag_type_repository = AsyncMock(spec=TagTypeRepository)
-        tag_type_service = TagTypeService(tag_type_repository=mock_tag_type_repository)
-
-        tag_type_id = UUID('123e4567-e89b-12d3-a456-426614174000')
-        existing_tag_type = TagType(id=tag_type_id, name='league')
-        mock_tag_type_repository.get_by_id.return_value = existing_tag_type
+        tag_type_id = league_tag_type.id
+        mock_tag_type_repo.get_by_id.return_value = league_tag_type
 
         # Act
         await tag_type_service.deactivate(tag_type_id)
 
         # Assert
-        mock_tag_type_repository.get_by_id.assert_called_once_with(tag_type_id)
-        mock_tag_type_repository.deactivate.assert_called_once_with(tag_type_id)
+        mock_tag_type_repo.get_by_id.assert_called_once_with(tag_type_id)
+        mock_tag_type_repo.deactivate.assert_called_once_with(tag_type_id)
 
     @pytest.mark.asyncio
-    async def test_delete_tag_type(self):
+    async def test_delete_tag_type(self, tag_type_service, mock_tag_type_repo, league_tag_type):
         """
         Test deleting a tag type.
 
@@ -267,16 +219,12 @@ class TestTagTypeService:
         Assert: Repository delete called
         """
         # Arrange
-        mock_tag_type_repository = AsyncMock(spec=TagTypeRepository)
-        tag_type_service = TagTypeService(tag_type_repository=mock_tag_type_repository)
-
-        tag_type_id = UUID('123e4567-e89b-12d3-a456-426614174000')
-        existing_tag_type = TagType(id=tag_type_id, name='league')
-        mock_tag_type_repository.get_by_id.return_value = existing_tag_type
+        tag_type_id = league_tag_type.id
+        mock_tag_type_repo.get_by_id.return_value = league_tag_type
 
         # Act
         await tag_type_service.delete(tag_type_id)
 
         # Assert
-        mock_tag_type_repository.get_by_id.assert_called_once_with(tag_type_id, include_deactivated=True)
-        mock_tag_type_repository.delete.assert_called_once_with(tag_type_id)
\ No newline at end of file
+        mock_tag_type_repo.get_by_id.assert_called_once_with(tag_type_id, include_deactivated=True)
+        mock_tag_type_repo.delete.assert_called_once_with(tag_type_id)
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+Unit tests for TeamService.create().
+
+Covers name and country_id validation, the active-country check and
+foreign key violations.
+
+Tests business logic layer for Team operations with mocked team and
+country repositories.
+"""
+
+import pytest
+from unittest.mock import call
+
+from app.exceptions import (
+    InvalidCountryError,
+    ValidationError
+)
+
+from tests.unit.services.support import fast_uuid
+from tests.unit.services.team_support import (
+    LONG_TEAM_NAME,
+    UNUSABLE_COUNTRIES,
+    fk_integrity_error,
+)
+
+_COUNTRY_ID = fast_uuid()
+
+
+class TestTeamServiceCreate:
+    """Test suite for team creation business logic."""
+
+    @pytest.mark.asyncio
+    async def test_create_team_with_valid_data_succeeds(
+        self, team_service, mock_team_repo, mock_country_repo, team_factory, country_factory
+    ):
+        """
+        Test that creating a team with valid data and active country succeeds (happy path).
+
+        Arrange: Mock repositories with active country and no existing team
+        Act: Call service.create() with valid data
+        Assert: Repository create called and team returned
+        """
+        # Arrange
+        country_id = fast_uuid()
+        team_data = {
+            "name": "Team USA",
+            "country_id": country_id
+        }
+
+        active_country = country_factory(id=country_id)
+
+        expected_team = team_factory(id=fast_uuid(), name="Team USA", country_id=country_id)
+
+        mock_country_repo.get_by_id.return_value = active_country
+        mock_team_repo.create.return_value = expected_team
+
+        # Act
+        result = await team_service.create(team_data)
+
+        # Assert
+        assert result == expected_team
+        assert result.name == "Team USA"
+        assert result.country_id == country_id
+        assert mock_country_repo.get_by_id.await_args_list == [
+            call(country_id, include_deactivated=False)
+        ]
+        assert mock_team_repo.create.await_args_list == [call(team_data)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("team_data,match", [
+        pytest.param({"name": "", "country_id": _COUNTRY_ID}, "Team name is required", id="empty-name"),
+        pytest.param({"name": "   ", "country_id": _COUNTRY_ID}, "Team name is required", id="whitespace-name"),
+        pytest.param(
+            {"name": LONG_TEAM_NAME, "country_id": _COUNTRY_ID},
+            "Team name must not exceed 100 characters",
+            id="name-too-long",
+        ),
+        pytest.param({"name": "Team USA"}, "country_id is required", id="missing-country-id"),
+    ])
+    async def test_create_team_rejects_invalid_input(
+        self, team_service, mock_team_repo, mock_country_repo, team_data, match
+    ):
+        """
+        Test that creating a team with a blank or too long name, or without
+        country_id, is rejected.
+
+        Arrange: Prepare invalid team data
+        Act: Attempt to create team
+        Assert: ValidationError raised before any repository call
+        """
+        # Act & Assert
+        with pytest.raises(ValidationError, match=match):
+            await team_service.create(team_data)
+
+        mock_country_repo.get_by_id.assert_not_awaited()
+        mock_team_repo.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("country_deactivated,match", UNUSABLE_COUNTRIES)
+    async def test_create_team_rejects_unusable_country(
+        self, team_service, mock_team_repo, mock_country_repo, country_factory,
+        country_deactivated, match
+    ):
+        """
+        Test that creating a team with a non-existent or deactivated country is rejected.
+
+        Arrange: Active country lookup returns None; the include_deactivated
+                 lookup returns None or a deactivated country
+        Act: Attempt to create team
+        Assert: InvalidCountryError raised with the matching message
+        """
+        # Arrange
+        country_id = fast_uuid()
+        team_data = {
+            "name": "Team USA",
+            "country_id": country_id
+        }
+
+        # First call (include_deactivated=False) returns None
+        # Second call (include_deactivated=True) finds nothing or the deactivated country
+        mock_country_repo.get_by_id.side_effect = [
+            None,
+            country_factory(id=country_id, is_deactivated=True) if country_deactivated else None
+        ]
+
+        # Act & Assert
+        with pytest.raises(InvalidCountryError, match=match):
+            await team_service.create(team_data)
+
+        # Should check without deleted first, then with deleted
+        assert mock_country_repo.get_by_id.await_args_list == [
+            call(country_id, include_deactivated=False),
+            call(country_id, include_deactivated=True)
+        ]
+        mock_team_repo.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_create_team_handles_foreign_key_constraint_violation(
+        self, team_service, mock_team_repo, mock_country_repo, country_factory
+    ):
+        """
+        Test that FK constraint violation is converted to InvalidCountryError.
+
+        Arrange: Mock repository raising IntegrityError on create
+        Act: Attempt to create team
+        Assert: InvalidCountryError raised
+        """
+        # Arrange
+        country_id = fast_uuid()
+        team_data = {
+            "name": "Team USA",
+            "country_id": country_id
+        }
+
+        active_country = country_factory(id=country_id)
+
+        mock_country_repo.get_by_id.return_value = active_country
+
+        # Repository raises IntegrityError (FK constraint)
+        mock_team_repo.create.side_effect = fk_integrity_error()
+
+        # Act & Assert
+        with pytest.raises(InvalidCountryError, match="Country not found"):
+            await team_service.create(team_data)
+
+        assert mock_team_repo.create.await_args_list == [call(team_data)]
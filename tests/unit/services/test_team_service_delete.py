@@ -0,0 +1,52 @@
+"""
+Unit tests for TeamService.deactivate() and delete().
+
+Tests business logic layer for Team operations with mocked team and
+country repositories.
+"""
+
+import pytest
+from contextlib import nullcontext
+from unittest.mock import call
+
+from app.exceptions import TeamNotFoundError
+
+from tests.unit.services.support import fast_uuid
+
+
+class TestTeamServiceDeletion:
+    """Test suite for team deactivation and permanent deletion business logic."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["deactivate", "delete"])
+    @pytest.mark.parametrize("team_exists", [
+        pytest.param(True, id="exists"),
+        pytest.param(False, id="non-existent"),
+    ])
+    async def test_deletion_delegates_to_repository(
+        self, team_service, mock_team_repo, method, team_exists
+    ):
+        """
+        Test that deactivate/delete delegate to the same-named repository method
+        and map a missing team to TeamNotFoundError.
+
+        Arrange: Repository method returns None, or raises ValueError when the
+                 team does not exist
+        Act: Call service.deactivate() or service.delete()
+        Assert: Repository method awaited once with the team ID;
+                TeamNotFoundError raised only for a non-existent team
+        """
+        # Arrange
+        team_id = fast_uuid()
+        repo_method = getattr(mock_team_repo, method)
+        if team_exists:
+            repo_method.return_value = None
+        else:
+            repo_method.side_effect = ValueError("Team not found")
+        expectation = nullcontext() if team_exists else pytest.raises(TeamNotFoundError)
+
+        # Act & Assert
+        with expectation:
+            await getattr(team_service, method)(team_id)
+
+        assert repo_method.await_args_list == [call(team_id)]
@@ -0,0 +1,108 @@
+"""
+Unit tests for TeamService retrieval (get_by_id, list_all, list_by_country).
+
+Tests business logic layer for Team operations with mocked team and
+country repositories.
+"""
+
+import pytest
+from unittest.mock import call
+
+from app.exceptions import TeamNotFoundError
+
+from tests.unit.services.support import fast_uuid
+
+
+class TestTeamServiceRetrieve:
+    """Test suite for team retrieval business logic."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,takes_id,include_deactivated", [
+        pytest.param("get_by_id", True, False, id="get_by_id"),
+        pytest.param("get_by_id", True, True, id="get_by_id-admin"),
+        pytest.param("list_all", False, None, id="list_all-default"),
+        pytest.param("list_all", False, False, id="list_all"),
+        pytest.param("list_all", False, True, id="list_all-admin"),
+        pytest.param("list_by_country", True, False, id="list_by_country"),
+    ])
+    async def test_read_returns_repository_result(
+        self, team_service, mock_team_repo, team_factory, method, takes_id, include_deactivated
+    ):
+        """
+        Test that get_by_id, list_all and list_by_country return the repository
+        result and forward include_deactivated.
+
+        Arrange: Repository method returns one team (get_by_id) or two teams;
+                 the admin cases include a deactivated team
+        Act: Call the same-named service method; include_deactivated=None
+             omits the argument to exercise the service default
+        Assert: Repository result returned; repository awaited once with the
+                same arguments, defaulting include_deactivated to False
+        """
+        # Arrange
+        args = (fast_uuid(),) if takes_id else ()
+        teams = [
+            team_factory(name="Team USA"),
+            team_factory(name="Team Canada", is_deactivated=bool(include_deactivated))
+        ]
+        expected = teams[-1] if method == "get_by_id" else teams
+        repo_method = getattr(mock_team_repo, method)
+        repo_method.return_value = expected
+
+        kwargs = {} if include_deactivated is None else {"include_deactivated": include_deactivated}
+
+        # Act
+        result = await getattr(team_service, method)(*args, **kwargs)
+
+        # Assert
+        assert result == expected
+        assert repo_method.await_args_list == [
+            call(*args, include_deactivated=bool(include_deactivated))
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_raises_not_found_error_when_not_exists(
+        self, team_service, mock_team_repo
+    ):
+        """
+        Test that get_by_id raises TeamNotFoundError for non-existent team.
+
+        Arrange: Mock repository returning None
+        Act: Call service.get_by_id()
+        Assert: TeamNotFoundError raised
+        """
+        # Arrange
+        team_id = fast_uuid()
+        mock_team_repo.get_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(TeamNotFoundError):
+            await team_service.get_by_id(team_id)
+
+        assert mock_team_repo.get_by_id.await_args_list == [
+            call(team_id, include_deactivated=False)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_by_country_returns_empty_list_when_no_teams(
+        self, team_service, mock_team_repo
+    ):
+        """
+        Test that list_by_country returns empty list when no teams exist.
+
+        Arrange: Mock repository returning empty list
+        Act: Call service.list_by_country()
+        Assert: Returns empty list
+        """
+        # Arrange
+        country_id = fast_uuid()
+        mock_team_repo.list_by_country.return_value = []
+
+        # Act
+        result = await team_service.list_by_country(country_id)
+
+        # Assert
+        assert result == []
+        assert mock_team_repo.list_by_country.await_args_list == [
+            call(country_id, include_deactivated=False)
+        ]
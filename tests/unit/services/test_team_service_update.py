@@ -0,0 +1,222 @@
+"""
+Unit tests for TeamService.update().
+
+Covers name validation, country changes and foreign key violations.
+
+Tests business logic layer for Team operations with mocked team and
+country repositories.
+"""
+
+import pytest
+from unittest.mock import call
+
+from app.exceptions import (
+    TeamNotFoundError,
+    InvalidCountryError,
+    ValidationError
+)
+
+from tests.unit.services.support import fast_uuid
+from tests.unit.services.team_support import (
+    LONG_TEAM_NAME,
+    UNUSABLE_COUNTRIES,
+    fk_integrity_error,
+)
+
+
+class TestTeamServiceUpdate:
+    """Test suite for team update business logic."""
+
+    @pytest.mark.asyncio
+    async def test_update_team_name_succeeds(self, team_service, mock_team_repo, team_factory):
+        """
+        Test that updating a team's name with valid data succeeds.
+
+        Arrange: Mock repositories with existing team
+        Act: Call service.update() with new name
+        Assert: Repository update called and updated team returned
+        """
+        # Arrange
+        team_id = fast_uuid()
+        country_id = fast_uuid()
+        update_data = {"name": "Team USA Elite"}
+
+        existing_team = team_factory(id=team_id, name="Team USA", country_id=country_id)
+
+        updated_team = team_factory(id=team_id, name="Team USA Elite", country_id=country_id)
+
+        mock_team_repo.get_by_id.return_value = existing_team
+        mock_team_repo.update.return_value = updated_team
+
+        # Act
+        result = await team_service.update(team_id, update_data)
+
+        # Assert
+        assert result == updated_team
+        assert result.name == "Team USA Elite"
+        assert mock_team_repo.get_by_id.await_args_list == [call(team_id, include_deactivated=True)]
+        assert mock_team_repo.update.await_args_list == [call(team_id, update_data)]
+
+    @pytest.mark.asyncio
+    async def test_update_team_country_to_valid_country_succeeds(
+        self, team_service, mock_team_repo, mock_country_repo, team_factory, country_factory
+    ):
+        """
+        Test that updating team's country to a valid active country succeeds.
+
+        Arrange: Mock repositories with existing team and valid new country
+        Act: Call service.update() with new country_id
+        Assert: Country validation performed and update succeeds
+        """
+        # Arrange
+        team_id = fast_uuid()
+        old_country_id = fast_uuid()
+        new_country_id = fast_uuid()
+        update_data = {"country_id": new_country_id}
+
+        existing_team = team_factory(id=team_id, name="Team USA", country_id=old_country_id)
+
+        new_country = country_factory(id=new_country_id, name="Canada", code="CAN")
+
+        updated_team = team_factory(id=team_id, name="Team USA", country_id=new_country_id)
+
+        mock_team_repo.get_by_id.return_value = existing_team
+        mock_country_repo.get_by_id.return_value = new_country
+        mock_team_repo.update.return_value = updated_team
+
+        # Act
+        result = await team_service.update(team_id, update_data)
+
+        # Assert
+        assert result == updated_team
+        assert result.country_id == new_country_id
+        assert mock_team_repo.get_by_id.await_args_list == [call(team_id, include_deactivated=True)]
+        assert mock_country_repo.get_by_id.await_args_list == [
+            call(new_country_id, include_deactivated=False)
+        ]
+        assert mock_team_repo.update.await_args_list == [call(team_id, update_data)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("update_data,match", [
+        pytest.param({"name": ""}, "Team name is required", id="empty-name"),
+        pytest.param({"name": LONG_TEAM_NAME}, "Team name must not exceed 100 characters", id="name-too-long"),
+    ])
+    async def test_update_team_rejects_invalid_name(
+        self, team_service, mock_team_repo, team_factory, update_data, match
+    ):
+        """
+        Test that updating a team to an empty or too long name is rejected.
+
+        Arrange: Mock repository with existing team
+        Act: Attempt to update with the invalid name
+        Assert: ValidationError raised before repository update
+        """
+        # Arrange
+        team_id = fast_uuid()
+        existing_team = team_factory(id=team_id, name="Team USA", country_id=fast_uuid())
+
+        mock_team_repo.get_by_id.return_value = existing_team
+
+        # Act & Assert
+        with pytest.raises(ValidationError, match=match):
+            await team_service.update(team_id, update_data)
+
+        assert mock_team_repo.get_by_id.await_args_list == [call(team_id, include_deactivated=True)]
+        mock_team_repo.update.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("country_deactivated,match", UNUSABLE_COUNTRIES)
+    async def test_update_team_rejects_unusable_country(
+        self, team_service, mock_team_repo, mock_country_repo, team_factory, country_factory,
+        country_deactivated, match
+    ):
+        """
+        Test that moving a team to a non-existent or deactivated country is rejected.
+
+        Arrange: Existing team; active country lookup returns None and the
+                 include_deactivated lookup returns None or a deactivated country
+        Act: Attempt to update with the new country_id
+        Assert: InvalidCountryError raised with the matching message
+        """
+        # Arrange
+        team_id = fast_uuid()
+        old_country_id = fast_uuid()
+        new_country_id = fast_uuid()
+        update_data = {"country_id": new_country_id}
+
+        existing_team = team_factory(id=team_id, name="Team USA", country_id=old_country_id)
+
+        mock_team_repo.get_by_id.return_value = existing_team
+        # First call returns None, second finds nothing or the deactivated country
+        mock_country_repo.get_by_id.side_effect = [
+            None,
+            country_factory(
+                id=new_country_id, name="Canada", code="CAN", is_deactivated=True
+            ) if country_deactivated else None
+        ]
+
+        # Act & Assert
+        with pytest.raises(InvalidCountryError, match=match):
+            await team_service.update(team_id, update_data)
+
+        assert mock_team_repo.get_by_id.await_args_list == [call(team_id, include_deactivated=True)]
+        assert mock_country_repo.get_by_id.await_args_list == [
+            call(new_country_id, include_deactivated=False),
+            call(new_country_id, include_deactivated=True)
+        ]
+        mock_team_repo.update.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_update_team_handles_non_existent_team(self, team_service, mock_team_repo):
+        """
+        Test that update raises error for non-existent team.
+
+        Arrange: Mock repository returning None
+        Act: Attempt to update non-existent team
+        Assert: TeamNotFoundError raised
+        """
+        # Arrange
+        team_id = fast_uuid()
+        update_data = {"name": "New Name"}
+
+        mock_team_repo.get_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(TeamNotFoundError):
+            await team_service.update(team_id, update_data)
+
+        assert mock_team_repo.get_by_id.await_args_list == [call(team_id, include_deactivated=True)]
+        mock_team_repo.update.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_update_team_handles_foreign_key_constraint_violation(
+        self, team_service, mock_team_repo, mock_country_repo, team_factory, country_factory
+    ):
+        """
+        Test that FK constraint violation on update is converted to InvalidCountryError.
+
+        Arrange: Mock repository raising IntegrityError on update
+        Act: Attempt to update team
+        Assert: InvalidCountryError raised
+        """
+        # Arrange
+        team_id = fast_uuid()
+        old_country_id = fast_uuid()
+        new_country_id = fast_uuid()
+        update_data = {"country_id": new_country_id}
+
+        existing_team = team_factory(id=team_id, name="Team USA", country_id=old_country_id)
+
+        new_country = country_factory(id=new_country_id, name="Canada", code="CAN")
+
+        mock_team_repo.get_by_id.return_value = existing_team
+        mock_country_repo.get_by_id.return_value = new_country
+
+        # Repository raises IntegrityError (FK constraint)
+        mock_team_repo.update.side_effect = fk_integrity_error()
+
+        # Act & Assert
+        with pytest.raises(InvalidCountryError, match="Country not found"):
+            await team_service.update(team_id, update_data)
+
+        assert mock_team_repo.update.await_args_list == [call(team_id, update_data)]